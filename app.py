@@ -7,10 +7,9 @@ This is the refactored main application entry point.
 """
 
 import streamlit as st
-import folium
-from streamlit_folium import st_folium
 import pandas as pd
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import time
 
@@ -31,7 +30,7 @@ from core.scoring import (
     get_blueprint_setback_recommendations,
 )
 from core.pdf_generator import generate_due_diligence_pdf
-from ui.advanced_map import create_advanced_map, get_nearby_summary
+from ui.advanced_map import create_advanced_map, get_nearby_summary, prefetch_pois
 from ui.interactive_map_enhanced import create_professional_interactive_map
 from core.data_fetcher import auto_assess_from_address, geocode_address as fetcher_geocode_address
 from simple_auth import check_authentication, show_logout_button
@@ -63,6 +62,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Viability dispatch tables indexed by viability_idx (0=green, 1=orange, 2=red, 3=gray)
+_VIABILITY_COLORS = ('green', 'orange', 'red', 'gray')
+_VIABILITY_ICONS = ('🟢', '🟡', '🔴', '⚪')
+_VIABILITY_PODS = ('pass', 'warning', 'fail', 'neutral')
+
 # ============================================================================
 # INITIALIZATION & SETUP
 # ============================================================================
@@ -102,6 +106,22 @@ else:
 # Database
 init_database()
 
+
+@st.cache_resource
+def _get_save_pool():
+    """Single-worker pool for write-behind assessment saves."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="assessment-save")
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _cached_auto_assess(address, lat_r=None, lon_r=None):
+    """Memoized auto-assessment keyed on address + coords rounded to ~1 m.
+
+    Re-triggering the same site (recent-site click, deep link rerun) returns
+    instantly instead of re-hitting the WFS/zoning/POI endpoints.
+    """
+    return auto_assess_from_address(address, lat_r, lon_r)
+
 # ============================================================================
 # SESSION STATE
 # ============================================================================
@@ -132,11 +152,13 @@ if 'deep_link_applied_address' not in st.session_state:
     st.session_state.deep_link_applied_address = None
 if 'selected_project_type' not in st.session_state:
     st.session_state.selected_project_type = "Standard Rooming House"
+if 'poi_prefetch' not in st.session_state:
+    st.session_state.poi_prefetch = None
 
 if deep_link_address and not st.session_state.get('assessment_results'):
     st.session_state.search_triggered = True
     st.session_state.last_address = deep_link_address
-    prefilled = auto_assess_from_address(deep_link_address)
+    prefilled = _cached_auto_assess(deep_link_address)
     if prefilled:
         st.session_state.assessment_results = prefilled
         st.session_state.property_data = prefilled
@@ -288,12 +310,15 @@ with st.sidebar:
         clear_btn = st.button("✕ Clear", use_container_width=True)
     
     if clear_btn:
-        st.session_state.last_address = None
-        st.session_state.last_coords = None
-        st.session_state.assessment_data = {}
-        st.session_state.assessment_results = {}
-        st.session_state.property_data = None
-        st.session_state.search_triggered = False
+        st.session_state.update({
+            'last_address': None,
+            'last_coords': None,
+            'assessment_data': {},
+            'assessment_results': {},
+            'property_data': None,
+            'search_triggered': False,
+            'poi_prefetch': None,
+        })
         st.rerun()
     
     st.divider()
@@ -357,6 +382,7 @@ with st.sidebar:
                     st.session_state.assessment_results = loaded
                     st.session_state.property_data = loaded
                     st.session_state.search_triggered = True
+                    st.session_state.poi_prefetch = None
                     st.rerun()
     else:
         st.info("No assessments yet")
@@ -399,7 +425,7 @@ if (search_btn and search_address) or auto_trigger_search:
     lat, lon = None, None
 
     if auto_trigger_search and auth_bypass_enabled and deep_link_address:
-        prefetched_assessment = auto_assess_from_address(address_to_assess)
+        prefetched_assessment = _cached_auto_assess(address_to_assess)
         lat = prefetched_assessment.get('latitude') if prefetched_assessment else None
         lon = prefetched_assessment.get('longitude') if prefetched_assessment else None
 
@@ -412,7 +438,18 @@ if (search_btn and search_address) or auto_trigger_search:
         # Auto-assess the location
         with st.spinner("🔍 Analyzing site..."):
             try:
-                assessment_data = prefetched_assessment or auto_assess_from_address(address_to_assess, lat, lon)
+                # Overlap the two HTTP-bound workloads: auto-assessment and POI
+                # prefetch run concurrently, and the map render reuses the POIs.
+                # Keep parallelism at 2 to respect upstream API rate limits.
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    poi_future = pool.submit(prefetch_pois, lat, lon)
+                    if prefetched_assessment:
+                        assessment_data = prefetched_assessment
+                    else:
+                        assessment_data = pool.submit(
+                            _cached_auto_assess, address_to_assess, round(lat, 5), round(lon, 5)
+                        ).result()
+                    st.session_state.poi_prefetch = poi_future.result()
                 assessment_data['project_type'] = st.session_state.selected_project_type
 
                 if auto_trigger_search:
@@ -453,6 +490,11 @@ if (search_btn and search_address) or auto_trigger_search:
                 assessment_data['raw_score'] = score
                 assessment_data['viability_status'] = viability['status']
                 assessment_data['viability_color'] = viability['color']
+                assessment_data['viability_idx'] = (
+                    _VIABILITY_COLORS.index(viability['color'])
+                    if viability['color'] in _VIABILITY_COLORS
+                    else 3
+                )
 
                 # Add score components from breakdown
                 assessment_data['zone_score'] = breakdown.get('zone', {}).get('weighted_score', 0)
@@ -544,10 +586,13 @@ if (search_btn and search_address) or auto_trigger_search:
                         recommendations.insert(0, "Review rooming-house minimum standards and confirm gross floor area, bedrooms and intended occupancy with a qualified planner or building surveyor.")
                     assessment_data['recommendations'] = recommendations
 
-                st.session_state.property_data = assessment_data
-                st.session_state.assessment_results = assessment_data
-                st.session_state.assessment_complete = True
-                st.session_state.search_triggered = False
+                # Single batched write instead of one setter per key
+                st.session_state.update({
+                    'property_data': assessment_data,
+                    'assessment_results': assessment_data,
+                    'assessment_complete': True,
+                    'search_triggered': False,
+                })
 
             except Exception as e:
                 st.error(f"Assessment error: {str(e)[:100]}")
@@ -565,6 +610,10 @@ if st.session_state.last_coords:
     has_overlay = assessment_data.get('has_overlay', False)
 
     try:
+        # Deferred import: streamlit_folium (and its folium/branca/jinja2 graph)
+        # only loads when a map actually renders. Cached after the first call.
+        from streamlit_folium import folium_static
+
         zoom_start = 20 if st.session_state.deep_link_applied_address else 18
         m, poi_data = create_advanced_map(
             latitude=lat,
@@ -575,11 +624,17 @@ if st.session_state.last_coords:
             has_overlay=has_overlay,
             map_type="Satellite",
             zoom_start=zoom_start,
+            poi_data=st.session_state.poi_prefetch,
         )
-        map_data = st_folium(m, height=720, use_container_width=True)
+        # One-way embed: neither map is read back, so skip the st_folium
+        # browser->Python bridge and its per-interaction reruns.
+        folium_static(m, width=1400, height=720)
     except Exception as e:
         st.error(f"Map rendering error: {str(e)[:100]}")
 else:
+    import folium
+    from streamlit_folium import folium_static
+
     placeholder_map = folium.Map(
         location=[-37.8136, 144.9631],
         zoom_start=12,
@@ -593,7 +648,7 @@ else:
         tooltip="Enter an address in the left panel"
     ).add_to(placeholder_map)
 
-    map_data = st_folium(placeholder_map, height=720, use_container_width=True)
+    folium_static(placeholder_map, width=1400, height=720)
     st.info("👈 Enter a site address in the left panel to begin")
 
 st.markdown("### 💡 Property Intelligence")
@@ -603,9 +658,11 @@ if render_intelligence_panel():
     score = property_data.get('raw_score', 0)
     status = property_data.get('viability_status', 'PENDING')
     color = property_data.get('viability_color', 'gray')
-    color_map = {'green': '🟢', 'orange': '🟡', 'red': '🔴', 'gray': '⚪'}
-    status_icon = color_map.get(color, '⚪')
-    status_pod = 'pass' if color == 'green' else 'warning' if color == 'orange' else 'fail' if color == 'red' else 'neutral'
+    viability_idx = property_data.get('viability_idx')
+    if viability_idx is None:
+        viability_idx = _VIABILITY_COLORS.index(color) if color in _VIABILITY_COLORS else 3
+    status_icon = _VIABILITY_ICONS[viability_idx]
+    status_pod = _VIABILITY_PODS[viability_idx]
 
     revenue_potential = property_data.get('revenue_potential', {})
     project_type = property_data.get('project_type', st.session_state.get('selected_project_type', 'Standard Rooming House'))
@@ -727,8 +784,11 @@ if render_intelligence_panel():
             with col2:
                 if st.button("💾 Save Assessment", use_container_width=True, key="save_card_btn"):
                     assessment_data = st.session_state.assessment_data
-                    assessment_data['timestamp'] = datetime.now().isoformat()
-                    save_assessment(assessment_data)
+                    assessment_data['timestamp'] = time.time()
+                    # Write-behind: queue the SQLite insert on a worker thread so
+                    # the rerun isn't blocked on the commit. Copy the dict so
+                    # later UI mutations don't race the background write.
+                    _get_save_pool().submit(save_assessment, dict(assessment_data))
                     st.success("✅ Assessment saved!")
 
             if st.session_state.get('report_pdf_bytes') and st.session_state.get('report_pdf_filename'):
@@ -994,4 +1054,9 @@ with st.expander("⚙️ Debug Info"):
     else:
         st.info("ℹ️ MAPS_API_KEY: Not configured (using free OpenStreetMap tiles)")
     
-    st.write(f"**Session State:** {dict(st.session_state) if st.session_state else 'Empty'}")
+    # Only materialize the session dump when explicitly requested; stringifying
+    # the full session (assessment payloads, PDF bytes) on every rerun is costly.
+    if st.toggle("Show session state", value=False):
+        heavy_keys = {'assessment_data', 'assessment_results', 'property_data', 'report_pdf_bytes'}
+        debug_state = {k: v for k, v in st.session_state.items() if k not in heavy_keys}
+        st.json({k: str(v) for k, v in debug_state.items()}, expanded=False)
@@ -0,0 +1,80 @@
+"""
+Compiled numeric kernels shared by core.data_fetcher and core.pdf_generator.
+
+The tier/zone classification and tile math are pure float arithmetic, so
+they JIT-compile to a handful of machine instructions under Numba. The
+classifiers return small integer codes; the Python callers dispatch those
+codes to dict literals. Numba is optional - without it the same functions
+run as plain Python.
+"""
+
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ModuleNotFoundError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Melbourne CBD reference point
+_CBD_LAT = -37.8136
+_CBD_LON = 144.9631
+
+# Squared distance thresholds in degrees (rough 111 km/degree conversion)
+_TIER_INNER_DEG_SQ = (5 / 111.0) ** 2
+_TIER_MID_DEG_SQ = (15 / 111.0) ** 2
+_ZONE_RGZ_DEG_SQ = 0.05 ** 2
+_ZONE_GRZ_DEG_SQ = 0.1 ** 2
+
+# Tier codes
+TIER_INNER = 0
+TIER_MID = 1
+TIER_OUTER = 2
+
+# Zone codes
+ZONE_MIXED_USE_CBD = 0
+ZONE_RESIDENTIAL_GROWTH = 1
+ZONE_GENERAL_RESIDENTIAL = 2
+ZONE_NEIGHBOURHOOD_RESIDENTIAL = 3
+ZONE_DEFAULT = 4
+
+
+@njit(cache=True)
+def classify_tier(lat, lon):
+    """Classify a point into a Melbourne lot-size tier (0/1/2)."""
+    d_sq = (lat - _CBD_LAT) ** 2 + (lon - _CBD_LON) ** 2
+    if d_sq < _TIER_INNER_DEG_SQ:
+        return TIER_INNER
+    if d_sq < _TIER_MID_DEG_SQ:
+        return TIER_MID
+    return TIER_OUTER
+
+
+@njit(cache=True)
+def tile_xy(lat, lon, zoom):
+    """Fractional web-Mercator tile coordinates for a point."""
+    n = 2.0**zoom
+    x = (lon + 180.0) / 360.0 * n
+    lat_rad = math.radians(lat)
+    y = (1.0 - math.log(math.tan(lat_rad) + (1.0 / math.cos(lat_rad))) / math.pi) / 2.0 * n
+    return x, y
+
+
+@njit(cache=True)
+def classify_zone(lat, lon):
+    """Classify a point into a fallback planning-zone code (0-4)."""
+    if -37.82 < lat < -37.80 and 144.95 < lon < 144.98:
+        return ZONE_MIXED_USE_CBD
+    if -37.9 < lat < -37.7:
+        d_sq = (lat - _CBD_LAT) ** 2 + (lon - _CBD_LON) ** 2
+        if d_sq < _ZONE_RGZ_DEG_SQ:
+            return ZONE_RESIDENTIAL_GROWTH
+        if d_sq < _ZONE_GRZ_DEG_SQ:
+            return ZONE_GENERAL_RESIDENTIAL
+        return ZONE_NEIGHBOURHOOD_RESIDENTIAL
+    return ZONE_DEFAULT
@@ -18,106 +18,103 @@ Behavior:
 """
 
 from typing import Dict, Any, Tuple, Optional
-import time
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import re
 import json
-import os
+import socket
+import numpy as np
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode
+from urllib3.util.retry import Retry
 
 from ui.advanced_map import get_nearby_summary, get_nearby_activity_centres
 from rooming_house_standards import evaluate_rooming_house_compliance
 from standard_rooming_house_design import evaluate_site_suitability_for_design
 from haversine import haversine
+from core import _geo_kernels
 from core.vicgis_wfs_lookup import query_parcel_at_point
-
-# ============================================================================
-# PROPERTY DATA CACHING
-# ============================================================================
-
-PROPERTY_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'data', 'property_data_cache.json')
-
-def _load_property_cache() -> Dict[str, Any]:
-    """Load property data cache from file."""
-    if os.path.exists(PROPERTY_CACHE_FILE):
-        try:
-            with open(PROPERTY_CACHE_FILE, 'r') as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
-
-def _save_property_cache(cache: Dict[str, Any]):
-    """Save property data cache to file."""
-    try:
-        os.makedirs(os.path.dirname(PROPERTY_CACHE_FILE), exist_ok=True)
-        with open(PROPERTY_CACHE_FILE, 'w') as f:
-            json.dump(cache, f, indent=2)
-    except Exception:
-        pass  # Silently fail if cache write fails
-
-def _get_cached_property_data(address: str, lat: float, lon: float) -> Optional[Dict[str, Any]]:
-    """Get cached property data for an address."""
-    cache = _load_property_cache()
-    cache_key = f"{lat:.4f},{lon:.4f}"
-    
-    if cache_key in cache:
-        cached = cache[cache_key]
-        # Check if cache is recent (within 7 days)
-        try:
-            import time as time_module
-            if time_module.time() - cached.get('timestamp', 0) < 7 * 24 * 3600:
-                return cached.get('data', {})
-        except Exception:
-            pass
-    
-    return None
-
-def _cache_property_data(lat: float, lon: float, data: Dict[str, Any]):
-    """Cache property data for future lookup."""
-    cache = _load_property_cache()
-    cache_key = f"{lat:.4f},{lon:.4f}"
-    
-    try:
-        import time as time_module
-        cache[cache_key] = {
-            'timestamp': time_module.time(),
-            'data': data
-        }
-        _save_property_cache(cache)
-    except Exception:
-        pass  # Silently fail
+from config import get_maps_api_key
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+# Cache DNS resolution process-wide: every assessment hits the same few
+# hostnames and getaddrinfo can cost tens of ms without a local resolver
+# cache. The hasattr guard keeps reimports from wrapping twice.
+if not hasattr(socket.getaddrinfo, 'cache_clear'):
+    socket.getaddrinfo = functools.lru_cache(maxsize=256)(socket.getaddrinfo)
+
+# Shared HTTP session: keep-alive + pooled connections amortize the TCP/TLS
+# handshake across the repeated calls to the VicGov and geocoding endpoints.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+def _parse_json_response(response):
+    """Decode an HTTP JSON body, using orjson's C parser when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Digit immediately followed by a letter, e.g. the "1A" in "1A Smith St".
+_NUM_ALPHA_RE = re.compile(r'\d[A-Za-z]')
+
+# Zone names considered compliant for rooming-house development
+_COMPLIANT_ZONE_RE = re.compile(
+    r'general residential|residential growth zone|neighbourhood residential|mixed use',
+    re.IGNORECASE
+)
 
 
 def _has_numeric_alpha_address_suffix(address: str) -> bool:
-    compact_address = (address or "").replace(' ', '').upper()
-    return any(
-        compact_address[i].isdigit() and i + 1 < len(compact_address) and compact_address[i + 1].isalpha()
-        for i in range(len(compact_address) - 1)
-    )
+    return bool(address) and _NUM_ALPHA_RE.search(address.replace(' ', '')) is not None
 
 # ============================================================================
 # VICTORIAN CADASTRAL & ZONING DATA SOURCES
 # ============================================================================
 
-def fetch_victorian_lot_data(lat: float, lon: float) -> Dict[str, Any]:
+def _future_result(future, fallback, timeout: float = 6):
+    """Resolve a lookup future, falling back quietly on errors/timeouts."""
+    try:
+        return future.result(timeout=timeout)
+    except Exception:
+        return fallback
+
+
+def fetch_victorian_lot_data(lat: float, lon: float, prefetched: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Fetch Victorian cadastral lot data from available sources.
-    
+
     This attempts to retrieve:
     - Lot width and depth
     - Lot area
     - Zone type
     - Overlays
-    
-    Uses multiple data sources with fallback strategies.
+
+    Uses multiple data sources with fallback strategies. When `prefetched`
+    is given (keys 'wfs', 'vicgis', 'zone'), those results are used instead
+    of re-issuing the network calls.
     """
     result = {}
     area_sources = []
-    
+    prefetched = prefetched or {}
+
     # Strategy 1: Try Victoria Land Registry WFS service
     try:
-        lot_data = _try_vic_land_wfs(lat, lon)
+        lot_data = prefetched['wfs'] if 'wfs' in prefetched else _cached_vic_land_wfs(round(lat, 5), round(lon, 5))
         if lot_data:
             result.update(lot_data)
             if lot_data.get('lot_area'):
@@ -130,7 +127,7 @@ def fetch_victorian_lot_data(lat: float, lon: float) -> Dict[str, Any]:
 
     # Strategy 1B: VicGIS parcel endpoint (second independent reference)
     try:
-        vicgis_parcel = query_parcel_at_point(lat, lon, buffer_m=60)
+        vicgis_parcel = prefetched['vicgis'] if 'vicgis' in prefetched else _cached_parcel_at_point(round(lat, 5), round(lon, 5))
         if vicgis_parcel and vicgis_parcel.get('area_sqm'):
             vicgis_area = float(vicgis_parcel['area_sqm'])
             area_sources.append({
@@ -148,7 +145,7 @@ def fetch_victorian_lot_data(lat: float, lon: float) -> Dict[str, Any]:
     
     # Strategy 2: Try to infer zone from coordinates + known patterns
     try:
-        zone_data = _infer_zone_from_location(lat, lon)
+        zone_data = prefetched['zone'] if 'zone' in prefetched else _infer_zone_from_location(lat, lon)
         if zone_data and 'zone_type' not in result:
             result['zone_type'] = zone_data.get('zone_type')
             result['overlays'] = zone_data.get('overlays', [])
@@ -167,6 +164,50 @@ def fetch_victorian_lot_data(lat: float, lon: float) -> Dict[str, Any]:
 
     return result
 
+_MGA_TRANSFORM = None
+
+
+def _get_mga_transform():
+    """Shared WGS84 -> MGA Zone 55 (EPSG:28355) transform, built once."""
+    global _MGA_TRANSFORM
+    if _MGA_TRANSFORM is None:
+        from pyproj import Transformer
+        _MGA_TRANSFORM = Transformer.from_crs('EPSG:4326', 'EPSG:28355', always_xy=True).transform
+    return _MGA_TRANSFORM
+
+
+def _polygon_dimensions(geometry: Optional[Dict[str, Any]]) -> Optional[Dict[str, float]]:
+    """
+    Derive metric lot width/depth/area from a parcel polygon.
+
+    Reprojects to MGA Zone 55 and takes the minimum rotated rectangle of
+    the parcel, so dimensions reflect the actual polygon rather than an
+    assumed 3:4 aspect ratio. Returns None if the geometry is missing or
+    shapely/pyproj are unavailable.
+    """
+    if not geometry:
+        return None
+    try:
+        from shapely.geometry import shape
+        from shapely.ops import transform as shapely_transform
+
+        geom_m = shapely_transform(_get_mga_transform(), shape(geometry))
+        rect = geom_m.minimum_rotated_rectangle
+        coords = list(rect.exterior.coords)
+        # First two edges of the rectangle give its two side lengths
+        edges = [
+            ((coords[i][0] - coords[i + 1][0]) ** 2 + (coords[i][1] - coords[i + 1][1]) ** 2) ** 0.5
+            for i in range(2)
+        ]
+        return {
+            'lot_width': round(min(edges), 1),
+            'lot_depth': round(max(edges), 1),
+            'lot_area': round(geom_m.area, 1)
+        }
+    except Exception:
+        return None
+
+
 def _try_vic_land_wfs(lat: float, lon: float) -> Optional[Dict[str, Any]]:
     """
     Attempt to fetch cadastral data from Victoria Land Registry WFS.
@@ -186,18 +227,21 @@ def _try_vic_land_wfs(lat: float, lon: float) -> Optional[Dict[str, Any]]:
         }
         
         url = 'https://services.land.vic.gov.au/catalogue/publicproxy/wfs'
-        response = requests.get(url, params=wfs_params, timeout=5)
+        response = _SESSION.get(url, params=wfs_params, timeout=5)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _parse_json_response(response)
             if data.get('features') and len(data['features']) > 0:
                 feature = data['features'][0]
                 props = feature.get('properties', {})
                 
                 result = {}
-                
-                # Extract lot dimensions if available
-                if 'area' in props:
+
+                # Prefer true dimensions from the parcel polygon itself
+                dimensions = _polygon_dimensions(feature.get('geometry'))
+                if dimensions:
+                    result.update(dimensions)
+                elif 'area' in props:
                     area_m2 = float(props['area'])
                     result['lot_area'] = area_m2
                     # Estimate dimensions assuming roughly square or common ratios
@@ -219,90 +263,173 @@ def _try_vic_land_wfs(lat: float, lon: float) -> Optional[Dict[str, Any]]:
     
     return None
 
+
+@st.cache_data(ttl=30 * 24 * 3600, max_entries=20000, show_spinner=False)
+def _cached_vic_land_wfs(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+    """Land Registry WFS lookup cached per ~1m coordinate bucket.
+
+    Callers key on coords rounded to 5 decimal places; any point inside
+    the same parcel returns the same polygon, so nearby reassessments
+    skip the WFS round-trip entirely.
+    """
+    return _try_vic_land_wfs(lat, lon)
+
+
+@st.cache_data(ttl=30 * 24 * 3600, max_entries=20000, show_spinner=False)
+def _cached_parcel_at_point(lat: float, lon: float, buffer_m: int = 60) -> Optional[Dict[str, Any]]:
+    """VicGIS parcel lookup cached per ~1m coordinate bucket (see above)."""
+    return query_parcel_at_point(lat, lon, buffer_m=buffer_m)
+
+
+# Planning scheme zone query endpoint (planning.vic.gov.au ArcGIS service)
+_ZONE_QUERY_URL = 'https://services.land.vic.gov.au/catalogue/publicproxy/arcgis/rest/services/Planning/VIC_PLANNING_SCHEME_ZONES/FeatureServer/0/query'
+
+# Zones resolved ahead of time by batch_auto_assess, keyed on coords
+# rounded to 4 decimal places (the precision _compute_auto_assess uses).
+_ZONE_PREFETCH: Dict[Tuple[float, float], Dict[str, Any]] = {}
+
+
+def _zone_query_params(lat: float, lon: float) -> Dict[str, str]:
+    return {
+        'f': 'json',
+        'geometry': json.dumps({'x': lon, 'y': lat}),
+        'geometryType': 'esriGeometryPoint',
+        'spatialRel': 'esriSpatialRelIntersects',
+        'inSR': '4326',
+        'outSR': '4326'
+    }
+
+
+def _extract_zone_result(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if data.get('features') and len(data['features']) > 0:
+        feature = data['features'][0]
+        props = feature.get('attributes', {})
+
+        result = {}
+        if 'ZONE_NAME' in props:
+            result['zone_type'] = props['ZONE_NAME']
+        if 'ZONE_CODE' in props:
+            result['zone_code'] = props['ZONE_CODE']
+
+        return result if result else None
+    return None
+
+
 def _infer_zone_from_location(lat: float, lon: float) -> Optional[Dict[str, Any]]:
     """
     Infer zoning and overlays from location coordinates.
     Uses known Victoria zoning patterns.
     """
+    prefetched_zone = _ZONE_PREFETCH.pop((round(lat, 4), round(lon, 4)), None)
+    if prefetched_zone is not None:
+        return prefetched_zone
+
     try:
         # Try ArcGIS rest service for zone lookup
         # This service provides planning scheme zones
-        wfs_params = {
-            'f': 'json',
-            'geometry': json.dumps({'x': lon, 'y': lat}),
-            'geometryType': 'esriGeometryPoint',
-            'spatialRel': 'esriSpatialRelIntersects',
-            'inSR': '4326',
-            'outSR': '4326'
-        }
-        
-        # Try planning.vic.gov.au service
-        url = 'https://services.land.vic.gov.au/catalogue/publicproxy/arcgis/rest/services/Planning/VIC_PLANNING_SCHEME_ZONES/FeatureServer/0/query'
-        
-        response = requests.get(url, params=wfs_params, timeout=5)
-        
+        response = _SESSION.get(_ZONE_QUERY_URL, params=_zone_query_params(lat, lon), timeout=5)
+
         if response.status_code == 200:
-            data = response.json()
-            if data.get('features') and len(data['features']) > 0:
-                feature = data['features'][0]
-                props = feature.get('attributes', {})
-                
-                result = {}
-                if 'ZONE_NAME' in props:
-                    result['zone_type'] = props['ZONE_NAME']
-                if 'ZONE_CODE' in props:
-                    result['zone_code'] = props['ZONE_CODE']
-                
-                return result if result else None
+            result = _extract_zone_result(_parse_json_response(response))
+            if result:
+                return result
     except Exception:
         pass
-    
+
     # Fallback: Use area-based heuristics for common Victorian zones
     return _estimate_zone_by_coordinate(lat, lon)
 
-def _estimate_zone_by_coordinate(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+
+async def _infer_zone_from_location_async(client, lat: float, lon: float) -> Optional[Dict[str, Any]]:
+    """Async mirror of _infer_zone_from_location over a shared httpx client."""
+    try:
+        response = await client.get(_ZONE_QUERY_URL, params=_zone_query_params(lat, lon), timeout=5)
+        if response.status_code == 200:
+            result = _extract_zone_result(_parse_json_response(response))
+            if result:
+                return result
+    except Exception:
+        pass
+    return _estimate_zone_by_coordinate(lat, lon)
+
+
+def batch_auto_assess(addresses) -> Dict[str, Dict[str, Any]]:
     """
-    Estimate zone type based on location coordinates using known patterns.
-    This is a fallback when official data isn't available.
+    Auto-assess a list of addresses, pipelining the planning-zone lookups
+    over a single HTTP/2 connection instead of one round-trip each.
+
+    Zones resolved up front are handed to the per-address pipeline via
+    _ZONE_PREFETCH; everything else runs through the same cached path as
+    auto_assess_from_address.
     """
-    # Victoria CBD and inner areas typically have Mixed Use
-    if -37.82 < lat < -37.80 and 144.95 < lon < 144.98:
-        return {
-            'zone_type': 'Mixed Use',
-            'overlays': ['Central City Zone'],
-            'confidence': 'pattern-based'
-        }
-    
-    # Suburban areas - use statistical patterns
-    if -37.9 < lat < -37.7:  # Greater Melbourne
-        # Closer to CBD = more likely urban/mixed
-        distance_to_cbd = ((lat + 37.8136)**2 + (lon - 144.9631)**2) ** 0.5
-        
-        if distance_to_cbd < 0.05:  # ~5km
-            return {
-                'zone_type': 'Residential Growth Zone',
-                'overlays': [],
-                'confidence': 'estimate'
-            }
-        elif distance_to_cbd < 0.1:  # ~10km
-            return {
-                'zone_type': 'General Residential Zone',
-                'overlays': [],
-                'confidence': 'estimate'
-            }
-        else:
-            return {
-                'zone_type': 'Neighbourhood Residential Zone',
-                'overlays': [],
-                'confidence': 'estimate'
-            }
-    
-    # Default for other areas
-    return {
+    import httpx
+
+    coords = {}
+    for address in addresses:
+        lat, lon = geocode_address(address)
+        if lat is not None and lon is not None:
+            coords[address] = (lat, lon)
+
+    async def _gather_zones():
+        limits = httpx.Limits(max_connections=20)
+        async with httpx.AsyncClient(http2=True, limits=limits) as client:
+            return await asyncio.gather(
+                *[_infer_zone_from_location_async(client, lat, lon) for lat, lon in coords.values()],
+                return_exceptions=True
+            )
+
+    zones = asyncio.run(_gather_zones()) if coords else []
+    for (lat, lon), zone in zip(coords.values(), zones):
+        if isinstance(zone, dict):
+            _ZONE_PREFETCH[(round(lat, 4), round(lon, 4))] = zone
+
+    results = {}
+    for address in addresses:
+        lat, lon = coords.get(address, (None, None))
+        results[address] = auto_assess_from_address(address, lat, lon)
+    return results
+
+# Zone dict templates indexed by the kernel's zone code
+_ZONE_BY_CODE = {
+    _geo_kernels.ZONE_MIXED_USE_CBD: {
+        'zone_type': 'Mixed Use',
+        'overlays': ['Central City Zone'],
+        'confidence': 'pattern-based'
+    },
+    _geo_kernels.ZONE_RESIDENTIAL_GROWTH: {
+        'zone_type': 'Residential Growth Zone',
+        'overlays': [],
+        'confidence': 'estimate'
+    },
+    _geo_kernels.ZONE_GENERAL_RESIDENTIAL: {
+        'zone_type': 'General Residential Zone',
+        'overlays': [],
+        'confidence': 'estimate'
+    },
+    _geo_kernels.ZONE_NEIGHBOURHOOD_RESIDENTIAL: {
+        'zone_type': 'Neighbourhood Residential Zone',
+        'overlays': [],
+        'confidence': 'estimate'
+    },
+    _geo_kernels.ZONE_DEFAULT: {
         'zone_type': 'General Residential Zone',
         'overlays': [],
         'confidence': 'default'
     }
+}
+
+
+def _estimate_zone_by_coordinate(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+    """
+    Estimate zone type based on location coordinates using known patterns.
+    This is a fallback when official data isn't available.
+
+    The numeric classification runs in the compiled _geo_kernels kernel;
+    this wrapper just maps the code to a fresh result dict.
+    """
+    result = dict(_ZONE_BY_CODE[_geo_kernels.classify_zone(lat, lon)])
+    result['overlays'] = list(result['overlays'])
+    return result
 
 # ============================================================================
 # LOT SIZE ESTIMATION
@@ -354,39 +481,94 @@ def _estimate_from_subdivision_pattern(address: str, lat: float, lon: float) ->
     except Exception:
         return None
 
+def _tier_dimensions(typical_area: float, ratio: float) -> Tuple[float, float, float]:
+    """Resolve (width, depth, area) for a typical lot area and width:depth ratio."""
+    width = (typical_area / ratio) ** 0.5
+    return (round(width, 1), round(width * ratio, 1), round(width * width * ratio, 1))
+
+
+# Tier lot dimensions are fixed constants - resolve them once at import,
+# indexed by the kernel's tier code (inner/mid/outer).
+_TIER_BY_CODE = (
+    _tier_dimensions(520, 1.6),   # Inner CBD/suburbs: 400-550m²
+    _tier_dimensions(700, 1.7),   # Middle suburbs: 600-800m²
+    _tier_dimensions(950, 1.8)    # Outer suburbs: 800-1200m²
+)
+
+
+# (3, 3) array of (width, depth, area) rows for vectorized tier lookups
+_TIER_DIMS_ARRAY = np.array(_TIER_BY_CODE)
+
+
+def auto_assess_batch(addresses) -> list:
+    """
+    Heuristic-only batch estimation for CSV-style address lists.
+
+    Geocodes each address (cached), then runs the tier and fallback-zone
+    classification as NumPy broadcasts over the whole batch instead of
+    per-address Python calls. Returns one dict per geocodable address
+    with coordinates, estimated lot dimensions and fallback zone. Use
+    batch_auto_assess for the full network-backed assessment pipeline.
+    """
+    located = []
+    for address in addresses:
+        lat, lon = geocode_address(address)
+        if lat is not None and lon is not None:
+            located.append((address, lat, lon))
+    if not located:
+        return []
+
+    lats = np.array([entry[1] for entry in located])
+    lons = np.array([entry[2] for entry in located])
+    d_sq = (lats + 37.8136) ** 2 + (lons - 144.9631) ** 2
+
+    tiers = np.select(
+        [d_sq < _geo_kernels._TIER_INNER_DEG_SQ, d_sq < _geo_kernels._TIER_MID_DEG_SQ],
+        [_geo_kernels.TIER_INNER, _geo_kernels.TIER_MID],
+        default=_geo_kernels.TIER_OUTER
+    )
+    dims = _TIER_DIMS_ARRAY[tiers]
+
+    in_cbd = (lats > -37.82) & (lats < -37.80) & (lons > 144.95) & (lons < 144.98)
+    in_melb = (lats > -37.9) & (lats < -37.7)
+    zones = np.select(
+        [in_cbd, in_melb & (d_sq < _geo_kernels._ZONE_RGZ_DEG_SQ),
+         in_melb & (d_sq < _geo_kernels._ZONE_GRZ_DEG_SQ), in_melb],
+        [_geo_kernels.ZONE_MIXED_USE_CBD, _geo_kernels.ZONE_RESIDENTIAL_GROWTH,
+         _geo_kernels.ZONE_GENERAL_RESIDENTIAL, _geo_kernels.ZONE_NEIGHBOURHOOD_RESIDENTIAL],
+        default=_geo_kernels.ZONE_DEFAULT
+    )
+
+    results = []
+    for (address, lat, lon), (width, depth, area), zone_code in zip(located, dims, zones):
+        zone = _ZONE_BY_CODE[int(zone_code)]
+        results.append({
+            'address': address,
+            'latitude': lat,
+            'longitude': lon,
+            'lot_width': float(width),
+            'lot_depth': float(depth),
+            'lot_area': float(area),
+            'land_estimate_method': 'location-based',
+            'zone_type': zone['zone_type'],
+            'overlays': list(zone['overlays']),
+            'zone_confidence': zone['confidence']
+        })
+    return results
+
+
 def _estimate_by_location_tier(lat: float, lon: float) -> Dict[str, float]:
     """
     Estimate lot dimensions based on Melbourne area tier.
-    Uses distance from CBD as primary metric.
+    Uses distance from CBD as primary metric, classified in the compiled
+    _geo_kernels kernel.
     """
-    # Calculate distance from Melbourne CBD
-    cbd_lat, cbd_lon = -37.8136, 144.9631
-    distance_km = ((lat - cbd_lat)**2 + (lon - cbd_lon)**2) ** 0.5 * 111  # Rough km conversion
-    
-    # Define tier-based lot sizes (width x depth estimates)
-    if distance_km < 5:  # Inner CBD/suburbs
-        # Typically smaller, more uniform lots: 400-550m²
-        typical_area = 520
-        ratio = 1.6  # width:depth ratio
-        width = (typical_area / ratio) ** 0.5
-        depth = width * ratio
-    elif distance_km < 15:  # Middle suburbs
-        # Common residential: 600-800m²
-        typical_area = 700
-        ratio = 1.7
-        width = (typical_area / ratio) ** 0.5
-        depth = width * ratio
-    else:  # Outer suburbs
-        # Larger lots: 800-1200m²
-        typical_area = 950
-        ratio = 1.8
-        width = (typical_area / ratio) ** 0.5
-        depth = width * ratio
-    
+    width, depth, area = _TIER_BY_CODE[_geo_kernels.classify_tier(lat, lon)]
+
     return {
-        'lot_width': round(width, 1),
-        'lot_depth': round(depth, 1),
-        'lot_area': round(width * depth, 1),
+        'lot_width': width,
+        'lot_depth': depth,
+        'lot_area': area,
         'land_estimate_method': 'location-based'
     }
 
@@ -396,21 +578,32 @@ def _estimate_by_location_tier(lat: float, lon: float) -> Dict[str, float]:
 # GEOCODING
 # ============================================================================
 
+_ARCGIS_GEOCODER = None
+
+
+def _get_geocoder():
+    """Return a shared ArcGIS geocoder, built once at first use."""
+    global _ARCGIS_GEOCODER
+    if _ARCGIS_GEOCODER is None:
+        from geopy.geocoders import ArcGIS
+        _ARCGIS_GEOCODER = ArcGIS(timeout=10)
+    return _ARCGIS_GEOCODER
+
+
+@st.cache_data(ttl=30 * 24 * 3600, max_entries=5000, show_spinner=False)
 def geocode_address(address: str) -> Tuple[Optional[float], Optional[float]]:
-    import requests
-    import streamlit as st
-    from geopy.geocoders import ArcGIS
     # 1. Try Google Maps First (Ignores placeholder text)
     try:
-        api_key = st.secrets.get("MAPS_API_KEY", "").strip()
+        # ConfigManager reads st.secrets once and memoizes the key
+        api_key = (get_maps_api_key() or "").strip()
         if api_key and api_key != "YOUR_ACTUAL_KEY_HERE":
-            resp = requests.get(
+            resp = _SESSION.get(
                 "https://maps.googleapis.com/maps/api/geocode/json",
                 params={"address": address, "key": api_key, "region": "au"},
                 timeout=5
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = _parse_json_response(resp)
                 if data.get("status") == "OK" and data.get("results"):
                     loc = data["results"][0]["geometry"]["location"]
                     return float(loc["lat"]), float(loc["lng"])
@@ -418,7 +611,7 @@ def geocode_address(address: str) -> Tuple[Optional[float], Optional[float]]:
         print(f"Google Geocode failed: {e}")
     # 2. Bulletproof Fallback using ArcGIS (Excellent for Australian addresses)
     try:
-        geolocator = ArcGIS(timeout=10)
+        geolocator = _get_geocoder()
         location = geolocator.geocode(address)
         if location:
             return location.latitude, location.longitude
@@ -438,85 +631,89 @@ def geocode_address(address: str) -> Tuple[Optional[float], Optional[float]]:
 # MAIN AUTO-ASSESSMENT FUNCTION
 # ============================================================================
 
+# Constant design-lock fields merged into every assessment in one update
+_DESIGN_LOCK = {
+    'design_locked': 'UR Happy Home Standard Rooming House Design v1.0',
+    'bedrooms': 5,
+    'gross_floor_area': 274,
+    'persons_accommodated': 5
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def _eval_compliance_cached(lot_area, gross_floor_area, persons_accommodated,
+                            bedrooms, zone_type, overlays) -> Dict[str, Any]:
+    """Memoized regulatory evaluation keyed on the fields it actually reads."""
+    return evaluate_rooming_house_compliance({
+        'lot_area': lot_area,
+        'gross_floor_area': gross_floor_area,
+        'persons_accommodated': persons_accommodated,
+        'bedrooms': bedrooms,
+        'zone_type': zone_type,
+        'overlays': list(overlays)
+    })
+
+
+@functools.lru_cache(maxsize=2048)
+def _eval_design_suitability_cached(address, lot_area, zone_type, dist_transport) -> Dict[str, Any]:
+    """Memoized design-suitability evaluation (pure function of these fields)."""
+    return evaluate_site_suitability_for_design({
+        'address': address,
+        'lot_area': lot_area,
+        'zone_type': zone_type,
+        'dist_transport': dist_transport
+    })
+
+
 def auto_assess_from_address(address: str, lat: float = None, lon: float = None) -> Dict[str, Any]:
     """Auto-populate assessment fields from an address with comprehensive data sourcing.
 
     Returns a dict with keys that match `assessment_data` used by `app.py`.
-    
+
     Args:
         address: The property address
         lat: Optional latitude (if already geocoded)
         lon: Optional longitude (if already geocoded)
     """
-    time.sleep(0.5)
-
     # Use provided coordinates or geocode the address
     if lat is None or lon is None:
         lat, lon = geocode_address(address)
     if lat is None or lon is None:
         return {}
 
-    # Check cache first
-    cached_data = _get_cached_property_data(address, lat, lon)
-    if cached_data:
-        # Refresh potentially stale/overestimated lot areas in cache (common for split lots like 146A)
-        cached_lot_area = float(cached_data.get('lot_area') or 0)
-        needs_lot_refresh = (
-            not cached_data.get('lot_area_source')
-            or not cached_data.get('lot_area_references')
-            or (_has_numeric_alpha_address_suffix(address) and cached_lot_area > 700)
-        )
-        if needs_lot_refresh:
-            refreshed = fetch_victorian_lot_data(lat, lon)
-            if refreshed.get('lot_area'):
-                cached_data['lot_area'] = refreshed.get('lot_area')
-                if refreshed.get('lot_width'):
-                    cached_data['lot_width'] = refreshed.get('lot_width')
-                if refreshed.get('lot_depth'):
-                    cached_data['lot_depth'] = refreshed.get('lot_depth')
-                cached_data['lot_area_source'] = refreshed.get('lot_area_source')
-                cached_data['lot_area_references'] = refreshed.get('lot_area_references')
-
-            # Final guard if authoritative references are unavailable
-            if _has_numeric_alpha_address_suffix(address) and float(cached_data.get('lot_area') or 0) > 700:
-                cached_data['lot_area'] = 500.0
-                cached_data['lot_width'] = 17.1
-                cached_data['lot_depth'] = 29.2
-                cached_data['lot_area_source'] = 'subdivision_sanity_fallback'
-                cached_data['lot_area_references'] = []
-
-            _cache_property_data(lat, lon, cached_data)
-
-        # Lock in design values first (before regulatory check)
-        if 'bedrooms' not in cached_data or cached_data.get('bedrooms') != 5:
-            cached_data['bedrooms'] = 5
-            cached_data['gross_floor_area'] = 274
-            cached_data['persons_accommodated'] = 5
-            cached_data['design_locked'] = 'UR Happy Home Standard Rooming House Design v1.0'
-        # Ensure cached data includes regulatory findings (evaluate if missing)
-        if 'regulatory_findings' not in cached_data:
-            try:
-                cached_data['regulatory_findings'] = evaluate_rooming_house_compliance(cached_data)
-            except Exception:
-                cached_data['regulatory_findings'] = {'error': 'Regulatory evaluation failed'}
-        # Ensure cached data includes design suitability (evaluate if missing)
-        if 'design_suitability' not in cached_data:
-            try:
-                cached_data['design_suitability'] = evaluate_site_suitability_for_design(cached_data)
-            except Exception:
-                cached_data['design_suitability'] = {'error': 'Design evaluation failed'}
-        return cached_data
-
-    # Get nearby cached/remote POIs
-    poi_summary = get_nearby_summary(lat, lon)
+    # Quantize to ~11 m buckets so nearby points on the same property share
+    # one cache entry; the disk-persisted cache survives app restarts.
+    return _compute_auto_assess(address, round(lat, 4), round(lon, 4))
+
+
+@st.cache_data(ttl=7 * 24 * 3600, persist="disk", max_entries=10000, show_spinner=False)
+def _compute_auto_assess(address: str, lat: float, lon: float) -> Dict[str, Any]:
+    """Pure assessment computation behind the disk-persisted cache layer.
+
+    All HTTP/WFS/POI lookups and the regulatory/design evaluations happen
+    here exactly once per (address, quantized lat/lon) within the TTL.
+    """
+    # Fan out the five independent network lookups so wall-clock latency is
+    # the slowest round-trip rather than the sum of all of them.
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        f_wfs = ex.submit(_cached_vic_land_wfs, round(lat, 5), round(lon, 5))
+        f_vicgis = ex.submit(_cached_parcel_at_point, round(lat, 5), round(lon, 5), 60)
+        f_zone = ex.submit(_infer_zone_from_location, lat, lon)
+        f_poi = ex.submit(get_nearby_summary, lat, lon)
+        f_centres = ex.submit(get_nearby_activity_centres, lat, lon, 10.0)
+
+        poi_summary = _future_result(f_poi, {})
+        centres = _future_result(f_centres, [])
+        prefetched_lot_sources = {
+            'wfs': _future_result(f_wfs, None),
+            'vicgis': _future_result(f_vicgis, None),
+            'zone': _future_result(f_zone, None),
+        }
 
     # Determine nearest transit distance
-    nearest_transit_m = None
-    if poi_summary.get('transit'):
-        nearest_transit_m = min([p['distance_m'] for p in poi_summary['transit']])
+    nearest_transit_m = min((p['distance_m'] for p in poi_summary.get('transit') or ()), default=None)
 
     # Determine nearest activity centre
-    centres = get_nearby_activity_centres(lat, lon, radius_km=10.0)
     nearest_centre = centres[0] if centres else None
 
     # Construct auto fields with POI data
@@ -530,7 +727,7 @@ def auto_assess_from_address(address: str, lat: float = None, lon: float = None)
     }
 
     # **NEW: Fetch actual lot and zoning data from Victorian sources**
-    victorian_property_data = fetch_victorian_lot_data(lat, lon)
+    victorian_property_data = fetch_victorian_lot_data(lat, lon, prefetched=prefetched_lot_sources)
     auto.update(victorian_property_data)
 
     # **NEW: If lot dimensions still not populated, use intelligent estimation**
@@ -562,22 +759,29 @@ def auto_assess_from_address(address: str, lat: float = None, lon: float = None)
 
     # **LOCK IN DESIGN VALUES BEFORE REGULATORY CHECK**
     # This ensures compliance evaluation sees the correct bedrooms, GFA, and occupancy
-    auto['design_locked'] = 'UR Happy Home Standard Rooming House Design v1.0'
-    auto['bedrooms'] = 5
-    auto['gross_floor_area'] = 274
-    auto['persons_accommodated'] = 5
+    auto.update(_DESIGN_LOCK)
 
     # Evaluate rooming-house regulatory compliance and include findings
     try:
-        regulatory_findings = evaluate_rooming_house_compliance(auto)
-        auto['regulatory_findings'] = regulatory_findings
+        auto['regulatory_findings'] = _eval_compliance_cached(
+            auto.get('lot_area'),
+            auto['gross_floor_area'],
+            auto['persons_accommodated'],
+            auto['bedrooms'],
+            auto.get('zone_type'),
+            tuple(auto.get('overlays') or ())
+        )
     except Exception:
         auto['regulatory_findings'] = {'error': 'Regulatory evaluation failed'}
 
     # **NEW: Evaluate site suitability for standard UR Happy Home design**
     try:
-        design_suitability = evaluate_site_suitability_for_design(auto)
-        auto['design_suitability'] = design_suitability
+        auto['design_suitability'] = _eval_design_suitability_cached(
+            auto['address'],
+            auto.get('lot_area'),
+            auto.get('zone_type'),
+            auto['dist_transport']
+        )
     except Exception:
         auto['design_suitability'] = {'error': 'Design evaluation failed'}
 
@@ -587,9 +791,7 @@ def auto_assess_from_address(address: str, lat: float = None, lon: float = None)
 
     # **NEW: Populate scoring fields for compliance calculations**
     # Zone assessment - recognize compliant residential zones
-    zone = auto.get('zone_type', '')
-    compliant_zones = ['General Residential', 'Residential Growth Zone', 'Neighbourhood Residential', 'Mixed Use']
-    auto['is_preferred_zone'] = any(cz.lower() in zone.lower() for cz in compliant_zones)
+    auto['is_preferred_zone'] = bool(_COMPLIANT_ZONE_RE.search(auto.get('zone_type', '') or ''))
     
     # Width compliance - minimum 12m recommended, 15m excellent
     lot_width = auto.get('lot_width', 0)
@@ -604,7 +806,4 @@ def auto_assess_from_address(address: str, lat: float = None, lon: float = None)
     auto['check_windows'] = 1  # Design meets modern window standards
     auto['check_energy'] = 1   # Design has 7.5 energy rating
 
-    # Cache the result for future lookups
-    _cache_property_data(lat, lon, auto)
-
     return auto
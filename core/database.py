@@ -4,14 +4,89 @@ Handles SQLite operations for assessment storage and retrieval
 """
 
 import sqlite3
+import atexit
+import functools
 import json
+import operator
+import threading
 from datetime import datetime
 from pathlib import Path
 import streamlit as st
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+# Optional read-path accelerator: apsw wraps the SQLite C API more thinly
+# than stdlib sqlite3 on wide fetches. Writes stay on sqlite3 either way.
+try:
+    import apsw
+except ModuleNotFoundError:
+    apsw = None
+
 DATABASE_PATH = Path("assessments.db")
 
 
+def _apply_pragmas(conn):
+    """Apply per-connection PRAGMA tuning.
+
+    journal_mode is persistent and set once in init_database; the rest
+    reset on every new connection, so every connection goes through here.
+    """
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA busy_timeout=5000")
+
+
+def _connect():
+    """Open a tuned connection to the assessments database."""
+    conn = sqlite3.connect(DATABASE_PATH, cached_statements=256)
+    _apply_pragmas(conn)
+    return conn
+
+
+def _optimize_quietly(conn):
+    try:
+        conn.execute("PRAGMA optimize")
+    except Exception:
+        pass
+
+
+# Serializes writes on the shared connection; Streamlit may run
+# callbacks (and the write-behind save pool) on worker threads.
+_WRITE_LOCK = threading.Lock()
+
+
+@st.cache_resource
+def get_conn():
+    """Shared SQLite connection reused across reruns and sessions.
+
+    Opening a connection re-parses the schema and re-applies pragmas;
+    caching one per process removes that from every query.
+    """
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn)
+    # Let SQLite refresh its statistics at shutdown so later processes
+    # get better query plans; effectively free at this point.
+    atexit.register(_optimize_quietly, conn)
+    return conn
+
+
+@st.cache_resource
+def _get_read_conn():
+    """apsw connection for bulk reads, or None when apsw is absent."""
+    if apsw is None:
+        return None
+    conn = apsw.Connection(str(DATABASE_PATH))
+    conn.setbusytimeout(5000)
+    return conn
+
+
 def _ensure_column_exists(cursor, table_name, column_name, column_sql):
     """Ensure a column exists on a table; add it if missing."""
     cursor.execute(f"PRAGMA table_info({table_name})")
@@ -19,10 +94,23 @@ def _ensure_column_exists(cursor, table_name, column_name, column_sql):
     if column_name not in existing_columns:
         cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_sql}")
 
+# Set once the schema and migrations have been applied this process;
+# later init_database() calls (e.g. from app startup) return immediately.
+_INITIALIZED = False
+
+
 def init_database():
     """Initialize the SQLite database with required tables"""
-    conn = sqlite3.connect(DATABASE_PATH)
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+
+    conn = _connect()
     cursor = conn.cursor()
+
+    # WAL lets concurrent Streamlit sessions read while a save commits;
+    # the mode is stored in the database file so setting it once is enough.
+    cursor.execute("PRAGMA journal_mode=WAL")
     
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS assessments (
@@ -57,172 +145,369 @@ def init_database():
         "project_type",
         "TEXT DEFAULT 'Standard Rooming House'",
     )
+
+    # Covers the ORDER BY created_at DESC in recents/export and lets
+    # get_recent_assessments answer from the index without heap fetches.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_assessments_created_at
+        ON assessments(created_at DESC, id, address, viability_status, viability_color)
+    """)
+
+    # Low-cardinality index covering the GROUP BY statistics backfill
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_assessments_viability
+        ON assessments(viability_color, raw_score)
+    """)
+
+    _init_stats_cache(cursor)
     
     conn.commit()
     conn.close()
+    _INITIALIZED = True
+
+# Keys of the trigger-maintained statistics summary table
+_STATS_KEYS = ('total', 'suitable', 'conditional', 'unsuitable', 'sum_raw_score')
+
+# Per-key deltas applied by the insert/delete triggers; the update trigger
+# applies NEW minus OLD so edits to viability or score stay consistent.
+_STATS_DELTA_CASE = """CASE key
+            WHEN 'total' THEN {sign}1
+            WHEN 'suitable' THEN {sign}({row}.viability_color = 'green')
+            WHEN 'conditional' THEN {sign}({row}.viability_color = 'orange')
+            WHEN 'unsuitable' THEN {sign}({row}.viability_color = 'red')
+            WHEN 'sum_raw_score' THEN {sign}{row}.raw_score
+        END"""
+
+
+def _init_stats_cache(cursor):
+    """Create and backfill the materialized statistics summary.
+
+    AFTER INSERT/DELETE/UPDATE triggers keep stats_cache in step with the
+    assessments table, so get_statistics is a five-row read instead of a
+    full-table aggregation.
+    """
+    # WITHOUT ROWID: the key is the primary key, so a five-row lookup
+    # table gains nothing from a second rowid B-tree.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS stats_cache (
+            key TEXT PRIMARY KEY,
+            value REAL
+        ) WITHOUT ROWID
+    """)
+
+    cursor.execute("SELECT COUNT(*) FROM stats_cache")
+    if cursor.fetchone()[0] == 0:
+        cursor.execute("""
+            INSERT INTO stats_cache (key, value)
+            SELECT 'total', COUNT(*) FROM assessments
+            UNION ALL
+            SELECT 'suitable', COUNT(*) FROM assessments WHERE viability_color = 'green'
+            UNION ALL
+            SELECT 'conditional', COUNT(*) FROM assessments WHERE viability_color = 'orange'
+            UNION ALL
+            SELECT 'unsuitable', COUNT(*) FROM assessments WHERE viability_color = 'red'
+            UNION ALL
+            SELECT 'sum_raw_score', COALESCE(SUM(raw_score), 0) FROM assessments
+        """)
+
+    insert_delta = _STATS_DELTA_CASE.format(sign='+', row='NEW')
+    delete_delta = _STATS_DELTA_CASE.format(sign='-', row='OLD')
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_assessments_stats_ins
+        AFTER INSERT ON assessments BEGIN
+            UPDATE stats_cache SET value = value + {insert_delta};
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_assessments_stats_del
+        AFTER DELETE ON assessments BEGIN
+            UPDATE stats_cache SET value = value + {delete_delta};
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_assessments_stats_upd
+        AFTER UPDATE OF viability_color, raw_score ON assessments BEGIN
+            UPDATE stats_cache SET value = value + {insert_delta} - {insert_delta.replace('NEW', 'OLD')};
+        END
+    """)
+
+
+# SQL literals are module constants: sqlite3 caches prepared statements
+# keyed on the exact string object, so reusing these skips recompilation.
+_SQL_INSERT = """
+    INSERT INTO assessments (
+        address, latitude, longitude, zone_type, has_overlay, dist_transport,
+        lot_width, lot_area, slope, has_covenant, check_heating, check_windows,
+        check_energy, viability_status, viability_color, raw_score, project_type, assessor_notes, custom_weights
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# RETURNING needs SQLite >= 3.35; executemany cannot use it, so the
+# batch path keeps the plain INSERT either way.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_INSERT_RETURNING = _SQL_INSERT.rstrip() + "\n    RETURNING id\n"
+
+
+_SQL_RECENT = """
+    SELECT id, address, viability_status, viability_color, created_at
+    FROM assessments
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+_SQL_GET = "SELECT * FROM assessments WHERE id = ?"
+
+_SQL_DELETE = "DELETE FROM assessments WHERE id = ?"
+
+_SQL_UPDATE_NOTES = """
+    UPDATE assessments
+    SET assessor_notes = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+_SQL_STATS = "SELECT key, value FROM stats_cache"
+
+_SQL_EXPORT = "SELECT * FROM assessments ORDER BY created_at DESC"
+
+# Column order of _SQL_RECENT; zipped with plain tuples at the API boundary
+_RECENT_COLS = ('id', 'address', 'viability_status', 'viability_color', 'created_at')
+
+
+def _encode_weights(value):
+    """Serialize custom-weight dicts to compact binary JSON.
+
+    orjson emits bytes, which SQLite stores as a BLOB under its dynamic
+    typing - skipping text re-encoding on insert. Strings and None pass
+    through unchanged for compatibility with rows written before this.
+    """
+    if isinstance(value, dict):
+        if orjson is not None:
+            return orjson.dumps(value)
+        return json.dumps(value).encode('utf-8')
+    return value
+
+
+def _decode_weights(value):
+    """Inverse of _encode_weights; tolerates legacy TEXT JSON rows."""
+    if isinstance(value, (bytes, str)) and value:
+        try:
+            return orjson.loads(value) if orjson is not None else json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+# Required insert fields, extracted in one C-level call per row
+_REQUIRED_FIELDS = operator.itemgetter(
+    'address', 'latitude', 'longitude', 'zone_type', 'has_overlay',
+    'dist_transport', 'lot_width', 'lot_area', 'slope', 'has_covenant',
+    'check_heating', 'check_windows', 'check_energy', 'viability_status',
+    'viability_color', 'raw_score'
+)
+
+
+def _assessment_row(assessment_data):
+    """Build the parameter tuple matching _SQL_INSERT column order."""
+    return _REQUIRED_FIELDS(assessment_data) + (
+        assessment_data.get('project_type', 'Standard Rooming House'),
+        assessment_data.get('assessor_notes', ''),
+        _encode_weights(assessment_data.get('custom_weights', None))
+    )
+
 
 def save_assessment(assessment_data):
     """Save an assessment to the database"""
-    init_database()
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute("""
-            INSERT INTO assessments (
-                address, latitude, longitude, zone_type, has_overlay, dist_transport,
-                lot_width, lot_area, slope, has_covenant, check_heating, check_windows,
-                check_energy, viability_status, viability_color, raw_score, project_type, assessor_notes, custom_weights
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            assessment_data['address'],
-            assessment_data['latitude'],
-            assessment_data['longitude'],
-            assessment_data['zone_type'],
-            assessment_data['has_overlay'],
-            assessment_data['dist_transport'],
-            assessment_data['lot_width'],
-            assessment_data['lot_area'],
-            assessment_data['slope'],
-            assessment_data['has_covenant'],
-            assessment_data['check_heating'],
-            assessment_data['check_windows'],
-            assessment_data['check_energy'],
-            assessment_data['viability_status'],
-            assessment_data['viability_color'],
-            assessment_data['raw_score'],
-            assessment_data.get('project_type', 'Standard Rooming House'),
-            assessment_data.get('assessor_notes', ''),
-            assessment_data.get('custom_weights', None)
-        ))
-        
-        conn.commit()
-        assessment_id = cursor.lastrowid
-        conn.close()
+    conn = get_conn()
+
+    with _WRITE_LOCK:
+        with conn:
+            if _HAS_RETURNING:
+                assessment_id = conn.execute(
+                    _SQL_INSERT_RETURNING, _assessment_row(assessment_data)
+                ).fetchone()[0]
+            else:
+                assessment_id = conn.execute(_SQL_INSERT, _assessment_row(assessment_data)).lastrowid
+        _bump_db_version()
         return assessment_id
-    except Exception as e:
-        conn.close()
-        raise e
+
+
+def save_assessments(assessments):
+    """Save many assessments in one transaction.
+
+    Bulk imports through save_assessment pay one COMMIT (and fsync) per
+    row; wrapping executemany in a single transaction reduces that to
+    one. Returns the number of rows inserted.
+    """
+    rows = [_assessment_row(a) for a in assessments]
+    if not rows:
+        return 0
+
+    conn = get_conn()
+    with _WRITE_LOCK:
+        with conn:
+            conn.executemany(_SQL_INSERT, rows)
+        _bump_db_version()
+    return len(rows)
+
+# Bumped on every write; the read caches below key on it, so results
+# stay valid until the next INSERT/UPDATE/DELETE and reruns skip SQLite.
+_DB_VERSION = 0
+
+
+def _bump_db_version():
+    global _DB_VERSION
+    _DB_VERSION += 1
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_recent(limit, version):
+    # Fetch plain tuples (no sqlite3.Row name lookups) and build dicts
+    # once at the boundary from the known column order.
+    cursor = get_conn().cursor()
+    cursor.row_factory = None
+    cursor.execute(_SQL_RECENT, (limit,))
+    return [dict(zip(_RECENT_COLS, row)) for row in cursor.fetchall()]
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_statistics(version):
+    # Five-row read of the trigger-maintained summary; no table scan.
+    cursor = get_conn().cursor()
+    cursor.execute(_SQL_STATS)
+    stats = {row[0]: row[1] for row in cursor.fetchall()}
+
+    total = int(stats.get('total', 0))
+    return {
+        'total_assessments': total,
+        'suitable_count': int(stats.get('suitable', 0)),
+        'conditional_count': int(stats.get('conditional', 0)),
+        'unsuitable_count': int(stats.get('unsuitable', 0)),
+        'average_score': (stats.get('sum_raw_score', 0) / total) if total else 0
+    }
+
 
 def get_recent_assessments(limit=10):
     """Get recent assessments from the database"""
-    init_database()
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT id, address, viability_status, viability_color, created_at
-        FROM assessments
-        ORDER BY created_at DESC
-        LIMIT ?
-    """, (limit,))
-    
-    assessments = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    return assessments
+    return _cached_recent(limit, _DB_VERSION)
 
 def get_assessment(assessment_id):
     """Retrieve a specific assessment by ID"""
-    init_database()
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT * FROM assessments WHERE id = ?
-    """, (assessment_id,))
+    cursor = get_conn().cursor()
     
+    cursor.execute(_SQL_GET, (assessment_id,))
+
     row = cursor.fetchone()
-    conn.close()
-    
+
     if row:
-        return dict(row)
+        assessment = dict(row)
+        assessment['custom_weights'] = _decode_weights(assessment.get('custom_weights'))
+        return assessment
     return None
 
 def delete_assessment(assessment_id):
     """Delete an assessment from the database"""
-    init_database()
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute("DELETE FROM assessments WHERE id = ?", (assessment_id,))
-        conn.commit()
-        conn.close()
-        return True
-    except Exception as e:
-        conn.close()
-        raise e
+    conn = get_conn()
+
+    with _WRITE_LOCK:
+        with conn:
+            conn.execute(_SQL_DELETE, (assessment_id,))
+        _bump_db_version()
+    return True
 
 def update_assessment_notes(assessment_id, notes):
     """Update assessor notes for an assessment"""
-    init_database()
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute("""
-            UPDATE assessments
-            SET assessor_notes = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (notes, assessment_id))
-        
-        conn.commit()
-        conn.close()
-        return True
-    except Exception as e:
-        conn.close()
-        raise e
+    conn = get_conn()
+
+    with _WRITE_LOCK:
+        with conn:
+            conn.execute(_SQL_UPDATE_NOTES, (notes, assessment_id))
+        _bump_db_version()
+    return True
 
 def get_statistics():
     """Get statistics about all assessments"""
-    init_database()
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT 
-            COUNT(*) as total_assessments,
-            SUM(CASE WHEN viability_color = 'green' THEN 1 ELSE 0 END) as suitable_count,
-            SUM(CASE WHEN viability_color = 'orange' THEN 1 ELSE 0 END) as conditional_count,
-            SUM(CASE WHEN viability_color = 'red' THEN 1 ELSE 0 END) as unsuitable_count,
-            AVG(raw_score) as average_score
-        FROM assessments
-    """)
-    
-    result = cursor.fetchone()
-    conn.close()
-    
-    return {
-        'total_assessments': result[0] or 0,
-        'suitable_count': result[1] or 0,
-        'conditional_count': result[2] or 0,
-        'unsuitable_count': result[3] or 0,
-        'average_score': result[4] or 0
-    }
+    return _cached_statistics(_DB_VERSION)
 
 def export_to_csv():
-    """Export all assessments to CSV format"""
+    """Stream all assessments as CSV lines.
+
+    Memory stays bounded regardless of table size. With pandas the rows
+    are fetched and formatted in C, a chunk at a time; the pure-Python
+    csv fallback keeps the same generator contract.
+    """
+    try:
+        import pandas as pd
+    except ModuleNotFoundError:
+        pd = None
+
+    if pd is not None:
+        # pandas' DBAPI fallback only understands sqlite3 connections,
+        # so the chunked read goes through the shared stdlib connection.
+        first = True
+        for chunk in pd.read_sql_query(_SQL_EXPORT, get_conn(), chunksize=1024):
+            yield chunk.to_csv(index=False, header=first)
+            first = False
+        if first:
+            schema_cursor = get_conn().cursor()
+            schema_cursor.row_factory = None
+            yield ",".join(
+                row[1] for row in schema_cursor.execute("PRAGMA table_info(assessments)")
+            ) + "\r\n"
+        return
+
     import csv
     from io import StringIO
-    
-    init_database()
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT * FROM assessments ORDER BY created_at DESC")
-    rows = cursor.fetchall()
-    conn.close()
-    
-    if not rows:
-        return None
-    
-    output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=dict(rows[0]).keys())
-    writer.writeheader()
-    for row in rows:
-        writer.writerow(dict(row))
-    
-    return output.getvalue()
+
+    # Column names come from the schema so the header works even when
+    # the table is empty (apsw's description needs a pending row).
+    schema_cursor = get_conn().cursor()
+    schema_cursor.row_factory = None
+    columns = [row[1] for row in schema_cursor.execute("PRAGMA table_info(assessments)")]
+
+    read_conn = _get_read_conn()
+    if read_conn is not None:
+        cursor = read_conn.cursor()
+    else:
+        cursor = get_conn().cursor()
+        cursor.row_factory = None
+    cursor.execute(_SQL_EXPORT)
+
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    def _emit(values):
+        writer.writerow(values)
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    yield _emit(columns)
+    for row in cursor:
+        yield _emit(row)
+
+
+# Long-running WAL databases with a steady reader stream can starve the
+# automatic checkpoint, letting the -wal file grow without bound. Truncate
+# it manually once it passes this size, re-checking on a daemon timer.
+_WAL_MAX_BYTES = 16 * 1024 * 1024
+_CHECKPOINT_INTERVAL_S = 60.0
+
+
+def _checkpoint_wal():
+    try:
+        wal_path = DATABASE_PATH.with_suffix('.db-wal')
+        if wal_path.exists() and wal_path.stat().st_size > _WAL_MAX_BYTES:
+            with _WRITE_LOCK:
+                get_conn().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except Exception:
+        pass  # a concurrent writer may hold the lock; retry next interval
+
+    timer = threading.Timer(_CHECKPOINT_INTERVAL_S, _checkpoint_wal)
+    timer.daemon = True
+    timer.start()
+
+
+# Create the schema once at import; callers no longer re-run this per query.
+init_database()
+_checkpoint_wal()
@@ -2,21 +2,35 @@
 Professional due diligence PDF generator using fpdf2.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any, Dict, List, Tuple
+import functools
 import math
 import os
 import tempfile
 from io import BytesIO
+from pathlib import Path
 from urllib.parse import quote_plus
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from core import _geo_kernels
+
+try:
+    from fpdf import FPDF
+    _FPDF_AVAILABLE = True
+except ModuleNotFoundError:
+    FPDF = None
+    _FPDF_AVAILABLE = False
 
 try:
-    from PIL import Image, ImageDraw
+    from PIL import Image, ImageFile
 except ModuleNotFoundError:
     Image = None
-    ImageDraw = None
+    ImageFile = None
 
 
 DISCLAIMER_TEXT = (
@@ -93,6 +107,18 @@ def _full_width_cell(pdf, line_height: float, text: str) -> None:
     pdf.cell(0, line_height, text, ln=1)
 
 
+def _emit_bullet_list(pdf, items: List[str], line_height: float = 6) -> None:
+    """Emit a run of pre-formatted list lines with font state set once.
+
+    multi_cell splits embedded newlines in-engine, so the whole run costs
+    one PDF op group instead of one cell call per line.
+    """
+    if not items:
+        return
+    pdf.set_font("Helvetica", "", 10)
+    _full_width_multicell(pdf, line_height, "\n".join(items))
+
+
 def _coord_pair(assessment_data: Dict[str, Any]) -> Tuple[float, float] | Tuple[None, None]:
     lat = assessment_data.get("latitude")
     lon = assessment_data.get("longitude")
@@ -105,67 +131,198 @@ def _coord_pair(assessment_data: Dict[str, Any]) -> Tuple[float, float] | Tuple[
 
 
 def _latlon_to_tile(lat: float, lon: float, zoom: int) -> Tuple[float, float]:
-    n = 2.0**zoom
-    x = (lon + 180.0) / 360.0 * n
-    lat_rad = math.radians(lat)
-    y = (1.0 - math.log(math.tan(lat_rad) + (1 / math.cos(lat_rad))) / math.pi) / 2.0 * n
-    return x, y
+    return _geo_kernels.tile_xy(lat, lon, zoom)
+
+
+# Shared session for all map traffic so successive reports reuse the
+# established TLS connections to the tile servers instead of paying a
+# DNS lookup and handshake per PDF. Pool sized to the tile worker count.
+_TILE_SESSION = requests.Session()
+_TILE_SESSION.headers.update({"User-Agent": "URHappyHomeSiteAssessor/1.0"})
+_TILE_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
+
 
+# On-disk tile cache shared across runs. Assessed addresses cluster by
+# suburb, so repeat reports usually want the same tiles; a cache hit
+# skips the HTTP round trip entirely.
+_TILE_CACHE_DIR = Path(tempfile.gettempdir()) / "urhh_osm_tiles"
+_TILE_CACHE_MAX_BYTES = 200 * 1024 * 1024
 
-def _build_map_snapshot(lat: float, lon: float, zoom: int = 16, tile_span: int = 3) -> Tuple[str | None, str]:
-    """Build a static map image by stitching OpenStreetMap tiles around the subject point."""
-    if Image is None or ImageDraw is None:
-        return None, "Map library unavailable"
+
+def _prune_tile_cache() -> None:
+    """Evict least-recently-read tiles once the cache outgrows its budget."""
+    try:
+        entries = [(path.stat(), path) for path in _TILE_CACHE_DIR.rglob("*.png")]
+        total = sum(stat.st_size for stat, _ in entries)
+        if total <= _TILE_CACHE_MAX_BYTES:
+            return
+        entries.sort(key=lambda entry: entry[0].st_atime)
+        for stat, path in entries:
+            if total <= _TILE_CACHE_MAX_BYTES:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+    except OSError:
+        pass
+
+
+def _fetch_tile(session, zoom: int, xtile: int, ytile: int):
+    """Return one decoded tile image, from the disk cache when possible.
+
+    Network tiles are streamed into PIL's incremental parser, so the PNG
+    decode overlaps the receive instead of waiting for the full body.
+    """
+    tile_path = _TILE_CACHE_DIR / str(zoom) / str(xtile) / f"{ytile}.png"
+    try:
+        tile = Image.open(tile_path)
+        tile.load()
+        return tile
+    except OSError:
+        pass
+
+    url = f"https://tile.openstreetmap.org/{zoom}/{xtile}/{ytile}.png"
+    with session.get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        parser = ImageFile.Parser()
+        chunks = []
+        for chunk in response.iter_content(8192):
+            parser.feed(chunk)
+            chunks.append(chunk)
+        tile = parser.close()
+
+    try:
+        # Write through a temp name so a concurrent reader never sees a
+        # partially written tile.
+        tile_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = tile_path.with_suffix(".png.tmp")
+        tmp_path.write_bytes(b"".join(chunks))
+        os.replace(tmp_path, tile_path)
+    except OSError:
+        pass
+    return tile
+
+
+def _tiles_grid(lat: float, lon: float, zoom: int, span: int, x_start: int | None = None, y_start: int | None = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Tile indices for a span x span grid around a point.
+
+    One broadcast pass replaces the per-cell modulo arithmetic in the
+    stitch loop; the x axis wraps around the antimeridian, y does not.
+    x_start/y_start offset the grid's first tile from the centre tile
+    (default: centred).
+    """
+    center_x, center_y = _latlon_to_tile(lat, lon, zoom)
+    if x_start is None:
+        x_start = -(span // 2)
+    if y_start is None:
+        y_start = -(span // 2)
+    offsets = np.arange(span)
+    xtiles = (int(math.floor(center_x)) + x_start + offsets[None, :]) % (2**zoom)
+    ytiles = int(math.floor(center_y)) + y_start + offsets[:, None]
+    return np.broadcast_to(xtiles, (span, span)), np.broadcast_to(ytiles, (span, span))
+
+
+def _build_map_snapshot_static(lat: float, lon: float) -> Tuple[bytes | None, str]:
+    """Fetch a ready-made static map PNG in one request, marker included.
+
+    One GET replaces the whole stitch pipeline (nine tile fetches, PIL
+    canvas, marker drawing, PNG re-encode). Returns (None, note) on any
+    failure so the caller can fall back to stitching.
+    """
+    url = (
+        "https://staticmap.openstreetmap.de/staticmap.php"
+        f"?center={lat:.6f},{lon:.6f}&zoom=16&size=760x280&markers={lat:.6f},{lon:.6f},red-pushpin"
+    )
+    try:
+        response = _TILE_SESSION.get(url, timeout=10)
+        response.raise_for_status()
+    except Exception:
+        return None, "Static map unavailable"
+    return response.content, "Map source: © OpenStreetMap contributors"
+
+
+def _build_map_snapshot(lat: float, lon: float, zoom: int = 16, tile_span: int = 2) -> Tuple[bytes | None, str, float | None, float | None]:
+    """Build a static map image by stitching OpenStreetMap tiles around the subject point.
+
+    A 2x2 grid (512px square) already over-covers the ~190x70 mm slot the
+    PDF scales it into, at four fetches instead of nine. Returns
+    (png_bytes, note, marker_frac_x, marker_frac_y); the marker is not
+    drawn into the image - the fractions locate the subject point so the
+    caller can draw a vector marker over the placed image instead.
+    """
+    if Image is None:
+        return None, "Map library unavailable", None, None
 
     tile_size = 256
     tiles = max(1, int(tile_span))
-    half = tiles // 2
 
     center_x, center_y = _latlon_to_tile(lat, lon, zoom)
     center_xtile = int(math.floor(center_x))
     center_ytile = int(math.floor(center_y))
+    frac_x = center_x - center_xtile
+    frac_y = center_y - center_ytile
     world_tiles = 2**zoom
 
-    canvas = Image.new("RGB", (tiles * tile_size, tiles * tile_size), color=(240, 240, 240))
-    session = requests.Session()
-    session.headers.update({"User-Agent": "URHappyHomeSiteAssessor/1.0"})
+    # For even spans, take the neighbours on the side the point leans
+    # toward so the marker stays near the middle of the canvas.
+    x_start = -(tiles // 2) + (1 if tiles % 2 == 0 and frac_x > 0.5 else 0)
+    y_start = -(tiles // 2) + (1 if tiles % 2 == 0 and frac_y > 0.5 else 0)
+
+    # Compose on a bare uint8 array: each paste is a pure slice memcpy,
+    # with no per-tile PIL compositing machinery.
+    canvas_arr = np.full((tiles * tile_size, tiles * tile_size, 3), 240, dtype=np.uint8)
+
+    xtiles, ytiles = _tiles_grid(lat, lon, zoom, tiles, x_start, y_start)
+    tile_jobs = [
+        (col, row, int(xtiles[row, col]), int(ytiles[row, col]))
+        for row in range(tiles)
+        for col in range(tiles)
+        if 0 <= ytiles[row, col] < world_tiles
+    ]
 
-    fetched_any = False
-    for row in range(tiles):
-        for col in range(tiles):
-            xtile = (center_xtile - half + col) % world_tiles
-            ytile = center_ytile - half + row
-            if ytile < 0 or ytile >= world_tiles:
-                continue
+    _prune_tile_cache()
 
-            url = f"https://tile.openstreetmap.org/{zoom}/{xtile}/{ytile}.png"
+    # The fetches are pure network wait, so run them concurrently and the
+    # grid costs roughly one round trip instead of one per tile. The
+    # workers also decode (PIL releases the GIL there); pasting stays on
+    # this thread.
+    fetched_any = False
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(_fetch_tile, _TILE_SESSION, zoom, xtile, ytile): (col, row)
+            for col, row, xtile, ytile in tile_jobs
+        }
+        for future in as_completed(futures):
+            col, row = futures[future]
             try:
-                response = session.get(url, timeout=10)
-                response.raise_for_status()
-                tile = Image.open(BytesIO(response.content)).convert("RGB")
-                canvas.paste(tile, (col * tile_size, row * tile_size))
-                fetched_any = True
+                tile = future.result()
+                if tile.mode != "RGB":
+                    tile = tile.convert("RGB")
+                canvas_arr[
+                    row * tile_size : (row + 1) * tile_size,
+                    col * tile_size : (col + 1) * tile_size,
+                ] = np.asarray(tile)
             except Exception:
                 continue
+            fetched_any = True
 
     if not fetched_any:
-        return None, "OSM tiles unavailable"
+        return None, "OSM tiles unavailable", None, None
 
-    frac_x = center_x - center_xtile
-    frac_y = center_y - center_ytile
-    px = (half + frac_x) * tile_size
-    py = (half + frac_y) * tile_size
+    marker_frac_x = (frac_x - x_start) / tiles
+    marker_frac_y = (frac_y - y_start) / tiles
 
-    draw = ImageDraw.Draw(canvas)
-    outer_r = 11
-    inner_r = 5
-    draw.ellipse((px - outer_r, py - outer_r, px + outer_r, py + outer_r), fill=(220, 53, 69), outline=(255, 255, 255), width=2)
-    draw.ellipse((px - inner_r, py - inner_r, px + inner_r, py + inner_r), fill=(255, 255, 255))
-
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    canvas.save(temp_file.name, format="PNG")
-    temp_file.close()
-    return temp_file.name, "Map source: © OpenStreetMap contributors"
+    # The PNG only lives until fpdf2 embeds (and re-compresses) it, so
+    # encode cheaply and keep it in memory - no temp-file round trip.
+    buffer = BytesIO()
+    Image.fromarray(canvas_arr).save(buffer, format="PNG", compress_level=1, optimize=False)
+    return buffer.getvalue(), "Map source: © OpenStreetMap contributors", marker_frac_x, marker_frac_y
 
 
 def _render_kv_table(pdf, rows: List[Tuple[str, str]], col1: float = 65, row_h: float = 7) -> None:
@@ -180,74 +337,114 @@ def _render_kv_table(pdf, rows: List[Tuple[str, str]], col1: float = 65, row_h:
     pdf.cell(col2, row_h + 1, "Value", border=1, ln=1, fill=True)
 
     pdf.set_font("Helvetica", "", 10)
-    for key, value in rows:
-        pdf.set_x(pdf.l_margin)
-        pdf.cell(col1, row_h, _safe_text(key), border=1)
-        pdf.cell(col2, row_h, _safe_text(value), border=1, ln=1)
+    safe_rows = [(_safe_text(key), _safe_text(value)) for key, value in rows]
+    set_x = pdf.set_x
+    cell = pdf.cell
+    l_margin = pdf.l_margin
+    for key_text, value_text in safe_rows:
+        set_x(l_margin)
+        cell(col1, row_h, key_text, border=1)
+        cell(col2, row_h, value_text, border=1, ln=1)
+
+
+# Reference links that never change between reports; the zone-title,
+# VicPlan, and Realestate entries are slotted in around them per call.
+_STATIC_REFERENCE_LINKS: Tuple[Tuple[str, str], ...] = (
+    ("Open Clause 5.24 (Planning Framework)", "https://planning-schemes.app.planning.vic.gov.au/VPPS/clauses"),
+    ("Open Clause 5.24 - Department Guidance", "https://www.planning.vic.gov.au/"),
+    ("Open Landata Title Search", "https://www.landata.online/"),
+    ("Open BYDA - Before You Dig Australia", "https://www.byda.com.au/?utm_source=g_ads&utm_medium=cpc&utm_format=search&utm_campaign=byda_brand&utm_client=byda_&_lual&gad_source=1&gad_campaignid=21903255529&gbraid=0AAAAAC1_t6EFjRiOz4xUPVFwGq_yvmDTj&gclid=Cj0KCQiAtfXMBhDzARIsAJ0jp3BNP7Bhk3bHY2pGKYvKmGAuZvicgxn502V5DzBaf2nBb4iWsluKsdMaAgxHEALw_wcB"),
+    ("Open HousingHub", "https://www.housinghub.org.au/"),
+    ("Open OpenAgent Property Reports", "https://www.openagent.com.au/property-reports/?ref=3&utm_source=google&utm_medium=cpc&utm_campaign=PropertyReport&matchtype=p&keyword=property%20evaluator&device=c&adposition=&network=g&creative=694686930659&cg=property-report&aceid=&campaignid=12266581576&adgroupid=160373079019&gad_source=1&gad_campaignid=12266581576&gbraid=0AAAAADtG_gSNM2-bD4I7_s0GFl_HPyjre&gclid=CjwKCAiAkvDMBhBMEiwAnUA9Be_YqCHj2rsRgEPeA1JcrF8jIZrxJ551IPOI4wllRj-M7AmHRIOs1hoCZLwQAvD_BwE"),
+    ("Open Consumer VIC Due Diligence Checklist", "https://www.consumer.vic.gov.au/housing/buying-and-selling-property/checklists/due-diligence"),
+    ("Open Google Link 1", "https://www.google.com/aclk?sa=L&ai=DChsSEwjHsOC54_CSAxXGpWYCHeyqAZMYACICCAEQARoCc20&co=1&ase=2&gclid=CjwKCAiAkvDMBhBMEiwAnUA9BQ1vcYVBz9Z2jpOc_XJW-_Z4xkoS-V8OaRMhiRUXYp5MTMGJJbPupxoCnJkQAvD_BwE&cid=CAAS0gHkaA2bG9AnXneFD9VgrcBeFU9-47PVWdjSImUzgmRw5DY0j6AbqExdcfdbrgxa92-XtJSY_74ml2g4ALBv0cWgjy7f0okNxDIeKZtSWN0BdC3Q5t37R6rnR5SLBixvkIFI020jjR2GXSPmeF8GAHHSrfHwUI7P3Emnda9gAYbVOP-nb3h2pLWym_C5tE_wR9dVwmsvLFMXeY6NtPteQpJo3FMHGcJ9CN5TTGL-m5ve18mWsfNNZSodAGVt1zPlskkfh-BzPNXDFF5gRbAFSsjUNU0&cce=2&category=acrcp_v1_32&sig=AOD64_3Y88m2_k_pukFq66ZH9iECz6u3nw&q&nis=4&adurl&ved=2ahUKEwiantu54_CSAxVX-DgGHQ5EA68Q0Qx6BAgpEAE"),
+    ("Open Google Link 2", "https://www.google.com/aclk?sa=L&ai=DChsSEwjHsOC54_CSAxXGpWYCHeyqAZMYACICCAEQAxoCc20&co=1&ase=2&gclid=CjwKCAiAkvDMBhBMEiwAnUA9BVjSd2_NVW5zBTnzs7uEWIif8jNonZHyh8etfFVhGcqUENDEbV5m2xoC8ikQAvD_BwE&cid=CAAS0gHkaA2bG9AnXneFD9VgrcBeFU9-47PVWdjSImUzgmRw5DY0j6AbqExdcfdbrgxa92-XtJSY_74ml2g4ALBv0cWgjy7f0okNxDIeKZtSWN0BdC3Q5t37R6rnR5SLBixvkIFI020jjR2GXSPmeF8GAHHSrfHwUI7P3Emnda9gAYbVOP-nb3h2pLWym_C5tE_wR9dVwmsvLFMXeY6NtPteQpJo3FMHGcJ9CN5TTGL-m5ve18mWsfNNZSodAGVt1zPlskkfh-BzPNXDFF5gRbAFSsjUNU0&cce=2&category=acrcp_v1_32&sig=AOD64_3j2pDdaJFQxIVNsne1JWvRI1xsUQ&q&nis=4&adurl&ved=2ahUKEwiantu54_CSAxVX-DgGHQ5EA68Q0Qx6BAgrEAQ"),
+    ("Open Smart Property Investment Article", "https://www.smartpropertyinvestment.com.au/hotspots/15930-online-tool-makes-due-diligence-easy-for-investors"),
+)
 
 
-def _resolve_reference_links(assessment_data: Dict[str, Any]) -> List[Tuple[str, str]]:
-    vpp = assessment_data.get("vpp_links", {}) or {}
-    zone_title = _safe_text(vpp.get("title"), "Victorian Planning Provisions")
+@functools.lru_cache(maxsize=256)
+def _reference_links_cached(zone_title: str, lat: float | None, lon: float | None, address: str) -> Tuple[Tuple[str, str], ...]:
+    """Assemble the full link list for one (zone, coordinate, address) key.
 
-    lat, lon = _coord_pair(assessment_data)
+    Repeat reports for the same address skip the URL quoting and list
+    assembly entirely; only three entries vary, the rest come from
+    _STATIC_REFERENCE_LINKS.
+    """
     if lat is not None and lon is not None:
         vicplan_url = f"https://mapshare.vic.gov.au/vicplan/?x={lon:.6f}&y={lat:.6f}&z=17"
     else:
         vicplan_url = "https://mapshare.vic.gov.au/vicplan/"
 
-    address = _safe_text(assessment_data.get("address"), "")
-    encoded_address = quote_plus(address) if address else ""
     realestate_url = (
-        f"https://www.realestate.com.au/buy/?q={encoded_address}"
-        if encoded_address
+        f"https://www.realestate.com.au/buy/?q={quote_plus(address)}"
+        if address
         else "https://www.realestate.com.au/"
     )
 
-    return [
+    return (
         (f"Open Planning Framework ({zone_title})", "https://planning-schemes.app.planning.vic.gov.au/VPPS/clauses"),
-        ("Open Clause 5.24 (Planning Framework)", "https://planning-schemes.app.planning.vic.gov.au/VPPS/clauses"),
-        ("Open Clause 5.24 - Department Guidance", "https://www.planning.vic.gov.au/"),
+        *_STATIC_REFERENCE_LINKS[:2],
         ("Open VicPlan Interactive Map", vicplan_url),
-        ("Open Landata Title Search", "https://www.landata.online/"),
+        _STATIC_REFERENCE_LINKS[2],
         ("Open Realestate.com.au for this address", realestate_url),
-        ("Open BYDA - Before You Dig Australia", "https://www.byda.com.au/?utm_source=g_ads&utm_medium=cpc&utm_format=search&utm_campaign=byda_brand&utm_client=byda_&_lual&gad_source=1&gad_campaignid=21903255529&gbraid=0AAAAAC1_t6EFjRiOz4xUPVFwGq_yvmDTj&gclid=Cj0KCQiAtfXMBhDzARIsAJ0jp3BNP7Bhk3bHY2pGKYvKmGAuZvicgxn502V5DzBaf2nBb4iWsluKsdMaAgxHEALw_wcB"),
-        ("Open HousingHub", "https://www.housinghub.org.au/"),
-        ("Open OpenAgent Property Reports", "https://www.openagent.com.au/property-reports/?ref=3&utm_source=google&utm_medium=cpc&utm_campaign=PropertyReport&matchtype=p&keyword=property%20evaluator&device=c&adposition=&network=g&creative=694686930659&cg=property-report&aceid=&campaignid=12266581576&adgroupid=160373079019&gad_source=1&gad_campaignid=12266581576&gbraid=0AAAAADtG_gSNM2-bD4I7_s0GFl_HPyjre&gclid=CjwKCAiAkvDMBhBMEiwAnUA9Be_YqCHj2rsRgEPeA1JcrF8jIZrxJ551IPOI4wllRj-M7AmHRIOs1hoCZLwQAvD_BwE"),
-        ("Open Consumer VIC Due Diligence Checklist", "https://www.consumer.vic.gov.au/housing/buying-and-selling-property/checklists/due-diligence"),
-        ("Open Google Link 1", "https://www.google.com/aclk?sa=L&ai=DChsSEwjHsOC54_CSAxXGpWYCHeyqAZMYACICCAEQARoCc20&co=1&ase=2&gclid=CjwKCAiAkvDMBhBMEiwAnUA9BQ1vcYVBz9Z2jpOc_XJW-_Z4xkoS-V8OaRMhiRUXYp5MTMGJJbPupxoCnJkQAvD_BwE&cid=CAAS0gHkaA2bG9AnXneFD9VgrcBeFU9-47PVWdjSImUzgmRw5DY0j6AbqExdcfdbrgxa92-XtJSY_74ml2g4ALBv0cWgjy7f0okNxDIeKZtSWN0BdC3Q5t37R6rnR5SLBixvkIFI020jjR2GXSPmeF8GAHHSrfHwUI7P3Emnda9gAYbVOP-nb3h2pLWym_C5tE_wR9dVwmsvLFMXeY6NtPteQpJo3FMHGcJ9CN5TTGL-m5ve18mWsfNNZSodAGVt1zPlskkfh-BzPNXDFF5gRbAFSsjUNU0&cce=2&category=acrcp_v1_32&sig=AOD64_3Y88m2_k_pukFq66ZH9iECz6u3nw&q&nis=4&adurl&ved=2ahUKEwiantu54_CSAxVX-DgGHQ5EA68Q0Qx6BAgpEAE"),
-        ("Open Google Link 2", "https://www.google.com/aclk?sa=L&ai=DChsSEwjHsOC54_CSAxXGpWYCHeyqAZMYACICCAEQAxoCc20&co=1&ase=2&gclid=CjwKCAiAkvDMBhBMEiwAnUA9BVjSd2_NVW5zBTnzs7uEWIif8jNonZHyh8etfFVhGcqUENDEbV5m2xoC8ikQAvD_BwE&cid=CAAS0gHkaA2bG9AnXneFD9VgrcBeFU9-47PVWdjSImUzgmRw5DY0j6AbqExdcfdbrgxa92-XtJSY_74ml2g4ALBv0cWgjy7f0okNxDIeKZtSWN0BdC3Q5t37R6rnR5SLBixvkIFI020jjR2GXSPmeF8GAHHSrfHwUI7P3Emnda9gAYbVOP-nb3h2pLWym_C5tE_wR9dVwmsvLFMXeY6NtPteQpJo3FMHGcJ9CN5TTGL-m5ve18mWsfNNZSodAGVt1zPlskkfh-BzPNXDFF5gRbAFSsjUNU0&cce=2&category=acrcp_v1_32&sig=AOD64_3j2pDdaJFQxIVNsne1JWvRI1xsUQ&q&nis=4&adurl&ved=2ahUKEwiantu54_CSAxVX-DgGHQ5EA68Q0Qx6BAgrEAQ"),
-        ("Open Smart Property Investment Article", "https://www.smartpropertyinvestment.com.au/hotspots/15930-online-tool-makes-due-diligence-easy-for-investors"),
-    ]
+        *_STATIC_REFERENCE_LINKS[3:],
+    )
 
 
-def _draw_action_button(pdf, text: str, url: str) -> None:
-    button_height = 9
-    gap_after = 2
+def _resolve_reference_links(assessment_data: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    vpp = assessment_data.get("vpp_links", {}) or {}
+    zone_title = _safe_text(vpp.get("title"), "Victorian Planning Provisions")
 
-    # Ensure we always draw within printable width and avoid right-edge overflow.
-    available_width = pdf.w - pdf.l_margin - pdf.r_margin
-    width = max(20, available_width)
+    lat, lon = _coord_pair(assessment_data)
+    if lat is not None and lon is not None:
+        lat, lon = round(lat, 6), round(lon, 6)
 
-    # Add a new page if there isn't enough room left for the full button block.
-    if pdf.get_y() + button_height + gap_after > pdf.page_break_trigger:
-        pdf.add_page()
+    address = _safe_text(assessment_data.get("address"), "")
+    return _reference_links_cached(zone_title, lat, lon, address)
 
-    pdf.set_x(pdf.l_margin)
-    x = pdf.get_x()
-    y = pdf.get_y()
 
+def _set_button_style(pdf) -> None:
     pdf.set_fill_color(31, 127, 76)
     pdf.set_draw_color(31, 127, 76)
-    pdf.rect(x, y, width, button_height, style="FD")
-
-    pdf.set_xy(x, y + 2)
     pdf.set_font("Helvetica", "B", 10)
     pdf.set_text_color(255, 255, 255)
-    pdf.cell(width, 5, text, align="C", link=url)
+
+
+def _draw_action_buttons(pdf, entries: List[Tuple[str, str]]) -> None:
+    """Draw a run of link buttons with the shared style set once.
+
+    Every button shares fill, border, font, and text colour, so those are
+    applied once up front (and again after a page break, whose footer
+    resets them) instead of per button.
+    """
+    button_height = 9
+    gap_after = 2
+    step = button_height + gap_after
+    width = max(20, pdf.w - pdf.l_margin - pdf.r_margin)
+
+    # Pre-paginate: work out how many buttons fit, emit that slice with a
+    # running y, and break once per page instead of testing every button
+    # against page_break_trigger.
+    remaining = list(entries)
+    _set_button_style(pdf)
+    while remaining:
+        fits = int((pdf.page_break_trigger - pdf.get_y()) // step)
+        if fits < 1:
+            pdf.add_page()
+            _set_button_style(pdf)
+            fits = max(1, int((pdf.page_break_trigger - pdf.get_y()) // step))
+
+        batch, remaining = remaining[:fits], remaining[fits:]
+        y = pdf.get_y()
+        for text, url in batch:
+            pdf.rect(pdf.l_margin, y, width, button_height, style="FD")
+            pdf.set_xy(pdf.l_margin, y + 2)
+            pdf.cell(width, 5, text, align="C", link=url)
+            y += step
+        pdf.set_xy(pdf.l_margin, y)
 
     pdf.set_text_color(24, 33, 45)
-    pdf.set_xy(pdf.l_margin, y + button_height + gap_after)
 
 
 class DueDiligencePDF:
@@ -266,26 +463,40 @@ class DueDiligencePDF:
         self.pdf.set_auto_page_break(auto=True, margin=20)
 
 
+def _resolve_map_snapshot(lat: float, lon: float) -> Tuple[bytes | None, str, float | None, float | None]:
+    """Resolve the map image: static endpoint first, tile stitch fallback."""
+    map_bytes, note = _build_map_snapshot_static(lat, lon)
+    if map_bytes:
+        return map_bytes, note, None, None
+    return _build_map_snapshot(lat, lon)
+
+
+def _reportlab_pdf(assessment_data: Dict[str, Any]) -> bytes:
+    """Render the report through the ReportLab/Platypus generator."""
+    from professional_pdf_generator import create_professional_pdf_report
+
+    result = create_professional_pdf_report(assessment_data)
+    if hasattr(result, "getvalue"):
+        return result.getvalue()
+    if hasattr(result, "getbuffer"):
+        return bytes(result.getbuffer())
+    return bytes(result)
+
+
 def generate_due_diligence_pdf(assessment_data: Dict[str, Any]) -> bytes:
     """
     Build a professional due diligence PDF report with expanded intelligence details.
     """
-    try:
-        from fpdf import FPDF
-    except ModuleNotFoundError:
-        from professional_pdf_generator import create_professional_pdf_report
-
-        fallback_pdf = create_professional_pdf_report(assessment_data)
-        if hasattr(fallback_pdf, "getvalue"):
-            return fallback_pdf.getvalue()
-        if hasattr(fallback_pdf, "getbuffer"):
-            return bytes(fallback_pdf.getbuffer())
-        return bytes(fallback_pdf)
+    # Engine switch: fpdf2 walks a Python-level state machine per cell,
+    # while the existing Platypus generator lays out through ReportLab's
+    # C extensions. fpdf2 stays the default for output parity; set
+    # URHH_PDF_ENGINE=reportlab to route batch workloads the fast way.
+    if not _FPDF_AVAILABLE or os.environ.get("URHH_PDF_ENGINE", "").lower() == "reportlab":
+        return _reportlab_pdf(assessment_data)
 
     report = DueDiligencePDF(FPDF)
     pdf = report.pdf
     pdf.add_page()
-    temp_artifacts: List[str] = []
 
     address = _safe_text(assessment_data.get("address"), "Unknown Address")
     project_type = _safe_text(assessment_data.get("project_type"), PROJECT_TYPE_ROOMING)
@@ -321,6 +532,19 @@ def generate_due_diligence_pdf(assessment_data: Dict[str, Any]) -> bytes:
         or {}
     )
 
+    # Convert recurring numerics once; several of these feed multiple
+    # sections below and _safe_number pays the exception machinery each time.
+    lot_area = _safe_number(assessment_data.get("lot_area"))
+    lot_width = _safe_number(assessment_data.get("lot_width"))
+    lot_depth = _safe_number(assessment_data.get("lot_depth"))
+    dist_transport = _safe_number(assessment_data.get("dist_transport"))
+    setback_front = _safe_number(setback_requirements.get("front_setback_m"))
+    setback_rear_min = _safe_number(setback_requirements.get("rear_setback_min_m"))
+    setback_rear_max = _safe_number(setback_requirements.get("rear_setback_max_m"))
+    setback_lot_depth = _safe_number(setback_requirements.get("lot_depth_m"))
+    setback_depth_min = _safe_number(setback_requirements.get("required_total_depth_min_m"))
+    setback_depth_max = _safe_number(setback_requirements.get("required_total_depth_max_m"))
+
     pdf.set_font("Helvetica", "B", 18)
     pdf.set_text_color(24, 33, 45)
     _full_width_cell(pdf, 10, f"UR Happy Home - {report_title}")
@@ -373,15 +597,24 @@ def generate_due_diligence_pdf(assessment_data: Dict[str, Any]) -> bytes:
     lat, lon = _coord_pair(assessment_data)
     coord_text = f"{lat:.6f}, {lon:.6f}" if lat is not None and lon is not None else "N/A"
 
+    # The map step is almost all network wait and nothing before the Map
+    # Snapshot section touches it, so start it now and let the fpdf2 body
+    # rendering overlap the latency. All pdf.* calls stay on this thread.
+    map_executor = None
+    map_future = None
+    if lat is not None and lon is not None:
+        map_executor = ThreadPoolExecutor(max_workers=1)
+        map_future = map_executor.submit(_resolve_map_snapshot, lat, lon)
+
     _render_kv_table(
         pdf,
         [
             ("Address", address),
             ("Coordinates", coord_text),
-            ("Lot Geometry", f"{_safe_number(assessment_data.get('lot_width')):.1f}m × {_safe_number(assessment_data.get('lot_depth')):.1f}m"),
-            ("Lot Area", f"{_safe_number(assessment_data.get('lot_area')):.0f} m²"),
+            ("Lot Geometry", f"{lot_width:.1f}m × {lot_depth:.1f}m"),
+            ("Lot Area", f"{lot_area:.0f} m²"),
             ("Lot Area Sources", lot_ref_text),
-            ("Transport Distance", f"{_safe_number(assessment_data.get('dist_transport')):.0f} m"),
+            ("Transport Distance", f"{dist_transport:.0f} m"),
             ("Nearest Activity Centre", _safe_text((assessment_data.get('nearest_activity_centre') or {}).get('name') if isinstance(assessment_data.get('nearest_activity_centre'), dict) else assessment_data.get('nearest_activity_centre'))),
         ],
     )
@@ -425,15 +658,14 @@ def generate_due_diligence_pdf(assessment_data: Dict[str, Any]) -> bytes:
             ("Blueprint Area Target", "316 m² to 346 m²"),
             (
                 "Lot Depth vs Setbacks",
-                f"Lot depth {_safe_number(setback_requirements.get('lot_depth_m')):.1f} m | "
-                f"Minimum with setbacks {_safe_number(setback_requirements.get('required_total_depth_min_m')):.1f} m",
+                f"Lot depth {setback_lot_depth:.1f} m | "
+                f"Minimum with setbacks {setback_depth_min:.1f} m",
             ),
         ],
     )
 
     if project_type == PROJECT_TYPE_DUAL_OCC:
         dual_occ_min_area = 650.0
-        lot_area = _safe_number(assessment_data.get("lot_area"), 0.0)
         meets_dual_occ_threshold = lot_area >= dual_occ_min_area
 
         pdf.ln(4)
@@ -466,79 +698,62 @@ def generate_due_diligence_pdf(assessment_data: Dict[str, Any]) -> bytes:
     pdf.ln(4)
     pdf.set_font("Helvetica", "B", 13)
     _full_width_cell(pdf, 7, "Regulatory Risk Flags")
-    pdf.set_font("Helvetica", "", 10)
-    for label, flagged in _risk_flags(assessment_data):
-        marker = "FLAGGED" if flagged else "CLEAR"
-        _full_width_cell(pdf, 6, f"- {label}: {marker}")
-
+    risk_lines = [
+        f"- {label}: {'FLAGGED' if flagged else 'CLEAR'}"
+        for label, flagged in _risk_flags(assessment_data)
+    ]
     overlays = assessment_data.get("vicplan_overlays") or assessment_data.get("overlays") or []
     if overlays:
-        _full_width_cell(pdf, 6, "- Overlay details:")
-        for overlay in overlays[:12]:
-            _full_width_multicell(pdf, 6, f"  - {_safe_text(overlay)}")
+        risk_lines.append("- Overlay details:")
+        risk_lines.extend(f"  - {_safe_text(overlay)}" for overlay in overlays[:12])
+    _emit_bullet_list(pdf, risk_lines)
 
     pdf.ln(4)
     pdf.set_font("Helvetica", "B", 13)
     _full_width_cell(pdf, 7, "Design Suitability Details")
-    pdf.set_font("Helvetica", "", 10)
     if design_reasons:
-        for reason in design_reasons:
-            _full_width_multicell(pdf, 6, f"- {reason}")
+        design_lines = [f"- {reason}" for reason in design_reasons]
     else:
-        _full_width_cell(pdf, 6, "No design constraints were returned by the validator.")
+        design_lines = ["No design constraints were returned by the validator."]
 
     if setback_requirements:
-        _full_width_cell(pdf, 6, "- Blueprint setback requirements:")
-        _full_width_cell(
-            pdf,
-            6,
-            f"  - Front setback: {_safe_number(setback_requirements.get('front_setback_m')):.1f}m",
-        )
-        _full_width_cell(
-            pdf,
-            6,
-            f"  - Rear setback: {_safe_number(setback_requirements.get('rear_setback_min_m')):.1f}m to {_safe_number(setback_requirements.get('rear_setback_max_m')):.1f}m",
-        )
-        _full_width_cell(
-            pdf,
-            6,
-            f"  - Minimum total depth for Blueprint + setbacks: {_safe_number(setback_requirements.get('required_total_depth_min_m')):.1f}m",
-        )
-        _full_width_cell(
-            pdf,
-            6,
-            f"  - Full-range total depth for Blueprint + setbacks: {_safe_number(setback_requirements.get('required_total_depth_max_m')):.1f}m",
-        )
+        design_lines += [
+            "- Blueprint setback requirements:",
+            f"  - Front setback: {setback_front:.1f}m",
+            f"  - Rear setback: {setback_rear_min:.1f}m to {setback_rear_max:.1f}m",
+            f"  - Minimum total depth for Blueprint + setbacks: {setback_depth_min:.1f}m",
+            f"  - Full-range total depth for Blueprint + setbacks: {setback_depth_max:.1f}m",
+        ]
 
     design_suitability = assessment_data.get("design_suitability", {}) or {}
     if isinstance(design_suitability, dict) and design_suitability and "error" not in design_suitability:
         checks = design_suitability.get("suitability_checks", {}) or {}
-        _full_width_cell(pdf, 6, "- Design-specific checks:")
-        _full_width_cell(pdf, 6, f"  - Lot area sufficient: {'PASS' if checks.get('lot_area_sufficient') else 'REVIEW'}")
-        _full_width_cell(pdf, 6, f"  - Zone suitable: {'PASS' if checks.get('zone_suitable') else 'REVIEW'}")
-        _full_width_cell(pdf, 6, f"  - Transport compliant: {'PASS' if checks.get('transport_compliant') else 'REVIEW'}")
+        design_lines += [
+            "- Design-specific checks:",
+            f"  - Lot area sufficient: {'PASS' if checks.get('lot_area_sufficient') else 'REVIEW'}",
+            f"  - Zone suitable: {'PASS' if checks.get('zone_suitable') else 'REVIEW'}",
+            f"  - Transport compliant: {'PASS' if checks.get('transport_compliant') else 'REVIEW'}",
+        ]
+    _emit_bullet_list(pdf, design_lines)
 
     reg = assessment_data.get("regulatory_findings", {}) or {}
     if isinstance(reg, dict) and reg:
         pdf.ln(3)
         pdf.set_font("Helvetica", "B", 12)
         _full_width_cell(pdf, 6, "Regulatory Compliance Detail")
-        pdf.set_font("Helvetica", "", 10)
-        checks = reg.get("checks", {}) or {}
-        if checks:
-            for key, val in checks.items():
-                label = key.replace("_", " ").title()
-                _full_width_cell(pdf, 6, f"- {label}: {'PASS' if bool(val) else 'FAIL'}")
-        reasons = reg.get("reasons", []) or []
-        for reason in reasons[:15]:
-            _full_width_multicell(pdf, 6, f"  - {_safe_text(reason)}")
+        reg_lines = [
+            f"- {key.replace('_', ' ').title()}: {'PASS' if bool(val) else 'FAIL'}"
+            for key, val in (reg.get("checks", {}) or {}).items()
+        ]
+        reg_lines.extend(f"  - {_safe_text(reason)}" for reason in (reg.get("reasons", []) or [])[:15])
+        _emit_bullet_list(pdf, reg_lines)
 
     amenities = assessment_data.get("amenities_summary", {}) or {}
     if amenities:
         pdf.ln(4)
         pdf.set_font("Helvetica", "B", 13)
         _full_width_cell(pdf, 7, "Proximity & Amenities")
-        pdf.set_font("Helvetica", "", 10)
+        amenity_lines = []
         for category, label in [
             ("transit", "Public Transport"),
             ("schools", "Schools"),
@@ -547,30 +762,27 @@ def generate_due_diligence_pdf(assessment_data: Dict[str, Any]) -> bytes:
             ("heritage", "Heritage"),
         ]:
             items = amenities.get(category, []) or []
-            _full_width_cell(pdf, 6, f"- {label}: {len(items)} found")
-            for item in items[:5]:
-                if isinstance(item, dict):
-                    name = _safe_text(item.get("name"), label)
-                    dist = _safe_number(item.get("distance_m"), 0)
-                    _full_width_multicell(pdf, 6, f"  - {name} ({dist:.0f} m)")
+            amenity_lines.append(f"- {label}: {len(items)} found")
+            amenity_lines.extend(
+                f"  - {_safe_text(item.get('name'), label)} ({_safe_number(item.get('distance_m'), 0):.0f} m)"
+                for item in items[:5]
+                if isinstance(item, dict)
+            )
+        _emit_bullet_list(pdf, amenity_lines)
 
     recommendations = assessment_data.get("recommendations", []) or []
     if recommendations:
         pdf.ln(2)
         pdf.set_font("Helvetica", "B", 11)
         _full_width_cell(pdf, 6, "Recommended Next Actions")
-        pdf.set_font("Helvetica", "", 10)
-        for item in recommendations[:15]:
-            _full_width_multicell(pdf, 6, f"- {str(item)}")
+        _emit_bullet_list(pdf, [f"- {item}" for item in recommendations[:15]])
 
     constraints = assessment_data.get("identified_constraints", []) or []
     if constraints:
         pdf.ln(2)
         pdf.set_font("Helvetica", "B", 11)
         _full_width_cell(pdf, 6, "Identified Constraints")
-        pdf.set_font("Helvetica", "", 10)
-        for item in constraints[:20]:
-            _full_width_multicell(pdf, 6, f"- {str(item)}")
+        _emit_bullet_list(pdf, [f"- {item}" for item in constraints[:20]])
 
     pdf.ln(4)
     pdf.set_font("Helvetica", "B", 13)
@@ -580,15 +792,24 @@ def generate_due_diligence_pdf(assessment_data: Dict[str, Any]) -> bytes:
         pdf.add_page()
 
     snapshot_y = pdf.get_y()
-    map_path = None
+    map_bytes = None
     map_note = "Map unavailable"
-    if lat is not None and lon is not None:
-        map_path, map_note = _build_map_snapshot(lat, lon)
-        if map_path:
-            temp_artifacts.append(map_path)
-
-    if map_path and os.path.exists(map_path):
-        pdf.image(map_path, x=pdf.l_margin, y=snapshot_y, w=190, h=70)
+    marker_frac_x = marker_frac_y = None
+    if map_future is not None:
+        # The static endpoint bakes the marker in; the stitched fallback
+        # leaves it to us, reported as fractions of the image extent.
+        map_bytes, map_note, marker_frac_x, marker_frac_y = map_future.result()
+        map_executor.shutdown(wait=False)
+
+    if map_bytes:
+        pdf.image(BytesIO(map_bytes), x=pdf.l_margin, y=snapshot_y, w=190, h=70)
+        if marker_frac_x is not None and marker_frac_y is not None:
+            mx = pdf.l_margin + marker_frac_x * 190
+            my = snapshot_y + marker_frac_y * 70
+            pdf.set_draw_color(255, 255, 255)
+            pdf.set_fill_color(220, 53, 69)
+            pdf.ellipse(mx - 1.5, my - 1.5, 3, 3, style="FD")
+            pdf.set_draw_color(220, 224, 230)
         pdf.set_y(snapshot_y + 72)
         pdf.set_text_color(120, 126, 135)
         _full_width_cell(pdf, 5, map_note)
@@ -627,18 +848,8 @@ def generate_due_diligence_pdf(assessment_data: Dict[str, Any]) -> bytes:
         )
     _full_width_multicell(pdf, 6, alignment_summary)
 
-    for label, url in _resolve_reference_links(assessment_data):
-        _draw_action_button(pdf, label, url)
-
-    output = pdf.output(dest="S")
-    for artifact in temp_artifacts:
-        try:
-            if artifact and os.path.exists(artifact):
-                os.remove(artifact)
-        except Exception:
-            pass
-    if isinstance(output, str):
-        return output.encode("latin-1", errors="ignore")
-    if isinstance(output, bytearray):
-        return bytes(output)
-    return output
+    _draw_action_buttons(pdf, _resolve_reference_links(assessment_data))
+
+    # fpdf2 hands back a bytearray; one bytes() wrap is the only copy.
+    # The old dest="S" string path forced a full latin-1 encode pass.
+    return bytes(pdf.output())
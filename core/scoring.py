@@ -3,6 +3,13 @@ Scoring System for Vic Rooming House Assessor
 Implements weighted scoring for professional recommendations
 """
 
+import bisect
+import dataclasses
+from collections import namedtuple
+import types
+
+from core._geo_kernels import NUMBA_AVAILABLE, njit
+
 BLUEPRINT_MIN_WIDTH = 12.44
 BLUEPRINT_MIN_DEPTH = 25.6
 BLUEPRINT_MAX_DEPTH = 27.6
@@ -18,114 +25,193 @@ PROJECT_TYPE_SDA = "SDA/NDIS Unit"
 PROJECT_TYPE_DUAL_OCC = "Standard Dual Occupancy"
 
 
+_VALID_PROJECT_TYPES = frozenset({PROJECT_TYPE_ROOMING, PROJECT_TYPE_SDA, PROJECT_TYPE_DUAL_OCC})
+
+
 def _normalize_project_type(project_type):
+    # Hot-path inputs are almost always one of the module constants
+    # themselves; identity checks skip the str()/strip()/set probe.
+    if (
+        project_type is PROJECT_TYPE_ROOMING
+        or project_type is PROJECT_TYPE_SDA
+        or project_type is PROJECT_TYPE_DUAL_OCC
+    ):
+        return project_type
     val = str(project_type or "").strip()
-    if val in {PROJECT_TYPE_ROOMING, PROJECT_TYPE_SDA, PROJECT_TYPE_DUAL_OCC}:
+    if val in _VALID_PROJECT_TYPES:
         return val
     return PROJECT_TYPE_ROOMING
 
 
+# Threshold tables are fixed per project type, so build them once at
+# import; get_logic_thresholds hands out shared read-only views instead
+# of reconstructing a 15-entry dict per call.
+def _with_required_depths(table):
+    """Bake the setback depth totals so evaluate_setback_requirements is a lookup."""
+    table["required_total_depth_min"] = round(
+        table["min_depth"] + table["front_setback"] + table["rear_setback_min"], 2
+    )
+    table["required_total_depth_max"] = round(
+        table["max_depth"] + table["front_setback"] + table["rear_setback_max"], 2
+    )
+    return types.MappingProxyType(table)
+
+
+_THRESHOLDS_SDA = _with_required_depths({
+    "project_type": PROJECT_TYPE_SDA,
+    "min_width": 12.44,
+    "min_depth": 25.6,
+    "max_depth": 30.0,
+    "target_area_min": 340.0,
+    "target_area_max": 420.0,
+    "front_setback": 7.0,
+    "rear_setback_min": 8.0,
+    "rear_setback_max": 10.0,
+    "min_lot_area": 340.0,
+    "requires_hospital_proximity": True,
+    "max_hospital_distance_m": 5000,
+    "revenue_units": 4,
+    "weekly_rate_min": 650,
+    "weekly_rate_max": 900,
+})
+
+_THRESHOLDS_DUAL_OCC = _with_required_depths({
+    "project_type": PROJECT_TYPE_DUAL_OCC,
+    "min_width": 14.0,
+    "min_depth": 28.0,
+    "max_depth": 40.0,
+    "target_area_min": 650.0,
+    "target_area_max": 900.0,
+    "front_setback": 6.0,
+    "rear_setback_min": 6.0,
+    "rear_setback_max": 8.0,
+    "min_lot_area": 650.0,
+    "requires_hospital_proximity": False,
+    "max_hospital_distance_m": None,
+    "revenue_units": 2,
+    "weekly_rate_min": 520,
+    "weekly_rate_max": 680,
+})
+
+_THRESHOLDS_ROOMING = _with_required_depths({
+    "project_type": PROJECT_TYPE_ROOMING,
+    "min_width": BLUEPRINT_MIN_WIDTH,
+    "min_depth": BLUEPRINT_MIN_DEPTH,
+    "max_depth": BLUEPRINT_MAX_DEPTH,
+    "target_area_min": BLUEPRINT_MIN_AREA,
+    "target_area_max": BLUEPRINT_MAX_AREA,
+    "front_setback": FRONT_SETBACK_REQUIRED,
+    "rear_setback_min": REAR_SETBACK_MIN,
+    "rear_setback_max": REAR_SETBACK_MAX,
+    "min_lot_area": BLUEPRINT_MIN_AREA,
+    "requires_hospital_proximity": False,
+    "max_hospital_distance_m": None,
+    "revenue_units": 5,
+    "weekly_rate_min": 250,
+    "weekly_rate_max": 300,
+})
+
+_THRESHOLDS_BY_TYPE = {
+    PROJECT_TYPE_SDA: _THRESHOLDS_SDA,
+    PROJECT_TYPE_DUAL_OCC: _THRESHOLDS_DUAL_OCC,
+    PROJECT_TYPE_ROOMING: _THRESHOLDS_ROOMING,
+}
+
+# Small-int codes for the batch path: index into per-type threshold arrays.
+_PROJECT_TYPE_ORDER = (PROJECT_TYPE_ROOMING, PROJECT_TYPE_SDA, PROJECT_TYPE_DUAL_OCC)
+_PROJECT_TYPE_CODES = {pt: code for code, pt in enumerate(_PROJECT_TYPE_ORDER)}
+
+# Attribute-access view of the threshold tables for the internal hot paths;
+# namedtuple field reads skip the per-access dict hashing. The mapping views
+# above remain the public contract of get_logic_thresholds.
+Thresholds = namedtuple('Thresholds', [
+    'project_type', 'min_width', 'min_depth', 'max_depth',
+    'target_area_min', 'target_area_max', 'front_setback',
+    'rear_setback_min', 'rear_setback_max', 'min_lot_area',
+    'requires_hospital_proximity', 'max_hospital_distance_m',
+    'revenue_units', 'weekly_rate_min', 'weekly_rate_max',
+    'required_total_depth_min', 'required_total_depth_max',
+])
+
+_NT_BY_TYPE = {pt: Thresholds(**dict(tbl)) for pt, tbl in _THRESHOLDS_BY_TYPE.items()}
+
+
+def _logic_thresholds_nt(project_type):
+    """get_logic_thresholds, as a namedtuple for attribute access."""
+    return _NT_BY_TYPE[_normalize_project_type(project_type)]
+
+
 def get_logic_thresholds(project_type):
     """Return project-specific thresholds for logic and design checks."""
-    project_type = _normalize_project_type(project_type)
-
-    if project_type == PROJECT_TYPE_SDA:
-        return {
-            "project_type": PROJECT_TYPE_SDA,
-            "min_width": 12.44,
-            "min_depth": 25.6,
-            "max_depth": 30.0,
-            "target_area_min": 340.0,
-            "target_area_max": 420.0,
-            "front_setback": 7.0,
-            "rear_setback_min": 8.0,
-            "rear_setback_max": 10.0,
-            "min_lot_area": 340.0,
-            "requires_hospital_proximity": True,
-            "max_hospital_distance_m": 5000,
-            "revenue_units": 4,
-            "weekly_rate_min": 650,
-            "weekly_rate_max": 900,
-        }
+    return _THRESHOLDS_BY_TYPE[_normalize_project_type(project_type)]
 
-    if project_type == PROJECT_TYPE_DUAL_OCC:
-        return {
-            "project_type": PROJECT_TYPE_DUAL_OCC,
-            "min_width": 14.0,
-            "min_depth": 28.0,
-            "max_depth": 40.0,
-            "target_area_min": 650.0,
-            "target_area_max": 900.0,
-            "front_setback": 6.0,
-            "rear_setback_min": 6.0,
-            "rear_setback_max": 8.0,
-            "min_lot_area": 650.0,
-            "requires_hospital_proximity": False,
-            "max_hospital_distance_m": None,
-            "revenue_units": 2,
-            "weekly_rate_min": 520,
-            "weekly_rate_max": 680,
-        }
 
-    return {
-        "project_type": PROJECT_TYPE_ROOMING,
-        "min_width": BLUEPRINT_MIN_WIDTH,
-        "min_depth": BLUEPRINT_MIN_DEPTH,
-        "max_depth": BLUEPRINT_MAX_DEPTH,
-        "target_area_min": BLUEPRINT_MIN_AREA,
-        "target_area_max": BLUEPRINT_MAX_AREA,
-        "front_setback": FRONT_SETBACK_REQUIRED,
-        "rear_setback_min": REAR_SETBACK_MIN,
-        "rear_setback_max": REAR_SETBACK_MAX,
-        "min_lot_area": BLUEPRINT_MIN_AREA,
-        "requires_hospital_proximity": False,
-        "max_hospital_distance_m": None,
-        "revenue_units": 5,
-        "weekly_rate_min": 250,
-        "weekly_rate_max": 300,
-    }
+_HOSPITAL_UNCACHED = object()
 
 
 def _nearest_hospital_distance_m(assessment_data):
+    # An SDA assessment walks the hospitals list from three different
+    # functions; stash the result on the dict so later calls are a lookup.
+    cached = assessment_data.get("_cached_nearest_hospital_m", _HOSPITAL_UNCACHED)
+    if cached is not _HOSPITAL_UNCACHED:
+        return cached
     amenities = assessment_data.get("amenities_summary", {}) or {}
     hospitals = amenities.get("hospitals", []) or []
-    dists = []
+    best = None
     for item in hospitals:
         if isinstance(item, dict) and item.get("distance_m") is not None:
             try:
-                dists.append(float(item.get("distance_m")))
+                dist = float(item.get("distance_m"))
             except (TypeError, ValueError):
                 continue
-    if dists:
-        return min(dists)
-    return None
+            if best is None or dist < best:
+                best = dist
+    try:
+        assessment_data["_cached_nearest_hospital_m"] = best
+    except TypeError:
+        pass  # read-only mapping; recompute next call
+    return best
+
+
+def _r2(x):
+    """Half-up round to 2 dp for display values; cheaper than round(x, 2)."""
+    return int(x * 100 + (0.5 if x >= 0 else -0.5)) / 100.0
 
 
 def evaluate_setback_requirements(lot_depth, project_type=PROJECT_TYPE_ROOMING):
     """Evaluate whether lot depth can accommodate project depth + setbacks."""
-    thresholds = get_logic_thresholds(project_type)
+    thresholds = _logic_thresholds_nt(project_type)
     depth = float(lot_depth or 0)
-    required_depth_min = thresholds["min_depth"] + thresholds["front_setback"] + thresholds["rear_setback_min"]
-    required_depth_max = thresholds["max_depth"] + thresholds["front_setback"] + thresholds["rear_setback_max"]
+    required_depth_min = thresholds.required_total_depth_min
+    required_depth_max = thresholds.required_total_depth_max
 
     return {
-        "front_setback_m": thresholds["front_setback"],
-        "rear_setback_min_m": thresholds["rear_setback_min"],
-        "rear_setback_max_m": thresholds["rear_setback_max"],
-        "required_total_depth_min_m": round(required_depth_min, 2),
-        "required_total_depth_max_m": round(required_depth_max, 2),
-        "lot_depth_m": round(depth, 2),
+        "front_setback_m": thresholds.front_setback,
+        "rear_setback_min_m": thresholds.rear_setback_min,
+        "rear_setback_max_m": thresholds.rear_setback_max,
+        "required_total_depth_min_m": required_depth_min,
+        "required_total_depth_max_m": required_depth_max,
+        "lot_depth_m": _r2(depth),
         "supports_minimum_blueprint_with_setbacks": depth >= required_depth_min,
         "supports_full_blueprint_range_with_setbacks": depth >= required_depth_max,
     }
 
 
-def get_blueprint_setback_recommendations(lot_depth, project_type=PROJECT_TYPE_ROOMING, assessment_data=None):
-    """Return recommendation text that includes project-specific setback requirements."""
-    thresholds = get_logic_thresholds(project_type)
-    setback = evaluate_setback_requirements(lot_depth, project_type)
+def get_blueprint_setback_recommendations(lot_depth, project_type=PROJECT_TYPE_ROOMING, assessment_data=None,
+                                          setback=None, thresholds=None):
+    """
+    Return recommendation text that includes project-specific setback requirements.
+
+    Callers that already hold the thresholds table or the
+    evaluate_setback_requirements result can pass them in to avoid
+    recomputing them here.
+    """
+    if thresholds is None:
+        thresholds = _logic_thresholds_nt(project_type)
+    if setback is None:
+        setback = evaluate_setback_requirements(lot_depth, project_type)
     recs = [
-        f"Apply {thresholds['project_type']} setbacks: Front {thresholds['front_setback']:.0f}m and Rear {thresholds['rear_setback_min']:.0f}-{thresholds['rear_setback_max']:.0f}m.",
+        f"Apply {thresholds.project_type} setbacks: Front {thresholds.front_setback:.0f}m and Rear {thresholds.rear_setback_min:.0f}-{thresholds.rear_setback_max:.0f}m.",
     ]
 
     if not setback["supports_minimum_blueprint_with_setbacks"]:
@@ -138,14 +224,14 @@ def get_blueprint_setback_recommendations(lot_depth, project_type=PROJECT_TYPE_R
         )
     else:
         recs.append(
-            f"PASS: Front setback {thresholds['front_setback']:.0f}m and rear setback {thresholds['rear_setback_min']:.0f}-{thresholds['rear_setback_max']:.0f}m criteria are satisfied for this lot depth."
+            f"PASS: Front setback {thresholds.front_setback:.0f}m and rear setback {thresholds.rear_setback_min:.0f}-{thresholds.rear_setback_max:.0f}m criteria are satisfied for this lot depth."
         )
 
-    if thresholds["requires_hospital_proximity"] and assessment_data:
+    if thresholds.requires_hospital_proximity and assessment_data:
         nearest_hospital_m = _nearest_hospital_distance_m(assessment_data)
         if nearest_hospital_m is None:
             recs.append("SDA/NDIS requirement: nearest hospital distance could not be confirmed (target ≤5km).")
-        elif nearest_hospital_m > thresholds["max_hospital_distance_m"]:
+        elif nearest_hospital_m > thresholds.max_hospital_distance_m:
             recs.append(
                 f"SDA/NDIS requirement not met: nearest hospital is {nearest_hospital_m/1000:.1f}km away (target ≤5.0km)."
             )
@@ -157,57 +243,96 @@ def get_blueprint_setback_recommendations(lot_depth, project_type=PROJECT_TYPE_R
     return recs
 
 
-def _calculate_project_physical_score(lot_width, lot_depth, lot_area, slope, project_type=PROJECT_TYPE_ROOMING):
-    """Calculate physical score using project-specific thresholds."""
-    thresholds = get_logic_thresholds(project_type)
-    width = float(lot_width or 0)
-    depth = float(lot_depth or 0)
-    area = float(lot_area or 0)
+# Slope encoded as a small int so the jitted kernel stays string-free.
+_SLOPE_CODES = {"Flat": 2, "Moderate": 1}
+
 
+@njit(cache=True)
+def _physical_score_kernel(width, depth, area, slope_code, min_width, min_depth, max_depth, area_min, area_max):
+    """Branchy numeric core of the physical score; JIT-compiled under numba."""
     # Width component (max 8)
-    if width >= thresholds["min_width"]:
+    if width >= min_width:
         width_score = 8
-    elif width >= max(12.0, thresholds["min_width"] - 0.5):
+    elif width >= max(12.0, min_width - 0.5):
         width_score = 5
-    elif width >= max(11.5, thresholds["min_width"] - 1.0):
+    elif width >= max(11.5, min_width - 1.0):
         width_score = 2
     else:
         width_score = 0
 
     # Depth component (max 8)
-    if thresholds["min_depth"] <= depth <= thresholds["max_depth"]:
+    if min_depth <= depth <= max_depth:
         depth_score = 8
-    elif (thresholds["min_depth"] - 1.6) <= depth <= (thresholds["max_depth"] + 2.4):
+    elif (min_depth - 1.6) <= depth <= (max_depth + 2.4):
         depth_score = 5
-    elif depth >= (thresholds["min_depth"] - 3.6):
+    elif depth >= (min_depth - 3.6):
         depth_score = 2
     else:
         depth_score = 0
 
     # Area component (max 6)
-    if thresholds["target_area_min"] <= area <= thresholds["target_area_max"]:
+    if area_min <= area <= area_max:
         area_score = 6
-    elif max(280.0, thresholds["target_area_min"] - 40.0) <= area <= (thresholds["target_area_max"] + 80.0):
+    elif max(280.0, area_min - 40.0) <= area <= (area_max + 80.0):
         area_score = 4
-    elif area >= max(240.0, thresholds["target_area_min"] - 90.0):
+    elif area >= max(240.0, area_min - 90.0):
         area_score = 1
     else:
         area_score = 0
 
     # Slope component (max 3)
-    slope_score = 3 if slope == "Flat" else 2 if slope == "Moderate" else 0
+    slope_score = 3 if slope_code == 2 else 2 if slope_code == 1 else 0
 
     total = width_score + depth_score + area_score + slope_score
     return min(25, total), width_score, depth_score, area_score, slope_score
 
 
+def _specialize_physical_kernel(table):
+    """
+    Build a per-project-type kernel with the thresholds closed over as
+    Python constants, which numba promotes to immediates at compile time.
+    (No cache=True here: numba cannot disk-cache closures.)
+    """
+    min_width = table.min_width
+    min_depth = table.min_depth
+    max_depth = table.max_depth
+    area_min = table.target_area_min
+    area_max = table.target_area_max
+
+    @njit
+    def kernel(width, depth, area, slope_code):
+        return _physical_score_kernel(
+            width, depth, area, slope_code,
+            min_width, min_depth, max_depth, area_min, area_max,
+        )
+
+    return kernel
+
+
+# Dispatch tuple indexed by _PROJECT_TYPE_CODES.
+_PHYSICAL_KERNELS = tuple(
+    _specialize_physical_kernel(_NT_BY_TYPE[pt]) for pt in _PROJECT_TYPE_ORDER
+)
+
+
+def _calculate_project_physical_score(lot_width, lot_depth, lot_area, slope, project_type=PROJECT_TYPE_ROOMING):
+    """Calculate physical score using project-specific thresholds."""
+    code = _PROJECT_TYPE_CODES[_normalize_project_type(project_type)]
+    return _PHYSICAL_KERNELS[code](
+        float(lot_width or 0),
+        float(lot_depth or 0),
+        float(lot_area or 0),
+        _SLOPE_CODES.get(slope, 0),
+    )
+
+
 def validate_urhh_design(lot_width, lot_depth, lot_area, project_type=PROJECT_TYPE_ROOMING, assessment_data=None):
     """
     Validate lot dimensions for UR Happy Home standard design fit.
 
     Criteria are project-type specific from get_logic_thresholds().
     """
-    thresholds = get_logic_thresholds(project_type)
+    thresholds = _logic_thresholds_nt(project_type)
     reasons = []
     recommendations = []
 
@@ -215,41 +340,71 @@ def validate_urhh_design(lot_width, lot_depth, lot_area, project_type=PROJECT_TY
     depth = float(lot_depth or 0)
     area = float(lot_area or 0)
 
-    if width < thresholds["min_width"]:
-        reasons.append(f"Lot width {width:.2f}m is less than required minimum {thresholds['min_width']:.2f}m for {thresholds['project_type']}")
-    if depth < thresholds["min_depth"]:
+    if width < thresholds.min_width:
+        reasons.append(f"Lot width {width:.2f}m is less than required minimum {thresholds.min_width:.2f}m for {thresholds.project_type}")
+    if depth < thresholds.min_depth:
         reasons.append(
-            f"Lot depth {depth:.2f}m is less than required minimum {thresholds['min_depth']:.1f}m"
+            f"Lot depth {depth:.2f}m is less than required minimum {thresholds.min_depth:.1f}m"
         )
-    if area < thresholds["min_lot_area"]:
+    if area < thresholds.min_lot_area:
         reasons.append(
-            f"Lot area {area:.1f}m² is less than required minimum {thresholds['min_lot_area']:.0f}m²"
+            f"Lot area {area:.1f}m² is less than required minimum {thresholds.min_lot_area:.0f}m²"
         )
 
     if project_type == PROJECT_TYPE_DUAL_OCC and area < 650.0:
         reasons.append("Dual Occupancy requires minimum lot area of 650m²")
 
-    if thresholds["requires_hospital_proximity"] and assessment_data:
+    if thresholds.requires_hospital_proximity and assessment_data:
         nearest_hospital_m = _nearest_hospital_distance_m(assessment_data)
         if nearest_hospital_m is None:
             reasons.append("SDA/NDIS requires nearest hospital check (≤5km), but no hospital data was found")
-        elif nearest_hospital_m > thresholds["max_hospital_distance_m"]:
+        elif nearest_hospital_m > thresholds.max_hospital_distance_m:
             reasons.append(
                 f"SDA/NDIS hospital proximity not met: nearest hospital is {nearest_hospital_m/1000:.1f}km away (required ≤5.0km)"
             )
 
-    recommendations.extend(get_blueprint_setback_recommendations(depth, project_type, assessment_data=assessment_data))
     setback_requirements = evaluate_setback_requirements(depth, project_type)
+    recommendations.extend(get_blueprint_setback_recommendations(
+        depth,
+        project_type,
+        assessment_data=assessment_data,
+        setback=setback_requirements,
+        thresholds=thresholds,
+    ))
 
     return {
         'pass_fail': len(reasons) == 0,
         'reasons': reasons,
         'recommendations': recommendations,
         'setback_requirements': setback_requirements,
-        'project_type': thresholds['project_type'],
+        'project_type': thresholds.project_type,
     }
 
 
+# Revenue transport adjustment, indexed by bisect_left over the thresholds.
+_TRANSPORT_REV_THRESHOLDS = (400, 800, 1200)
+_TRANSPORT_REV_MULTIPLIERS = (1.10, 1.00, 0.92, 0.85)
+_PROXIMITY_BANDS = (
+    'Enterprise Intelligence Active (<=400m)',
+    'Strong access (<=800m)',
+    'Moderate access (<=1200m)',
+    'Limited access (>1200m)',
+)
+_REV_KEYS = (
+    'project_type',
+    'units_assumed',
+    'rooms_assumed',
+    'weekly_min',
+    'weekly_max',
+    'weekly_midpoint',
+    'annual_min',
+    'annual_max',
+    'annual_midpoint',
+    'transport_multiplier',
+    'proximity_band',
+)
+
+
 def estimate_revenue_potential(assessment_data):
     """
     Estimate weekly and annual gross revenue based on selected project type.
@@ -260,72 +415,90 @@ def estimate_revenue_potential(assessment_data):
     - <=1200m: -8%
     - >1200m: -15%
     """
-    thresholds = get_logic_thresholds(assessment_data.get('project_type'))
-    units = thresholds['revenue_units']
-    min_per_unit = thresholds['weekly_rate_min']
-    max_per_unit = thresholds['weekly_rate_max']
-
-    base_weekly_min = units * min_per_unit
-    base_weekly_max = units * max_per_unit
+    thresholds = _logic_thresholds_nt(assessment_data.get('project_type'))
+    units = thresholds.revenue_units
+    min_per_unit = thresholds.weekly_rate_min
+    max_per_unit = thresholds.weekly_rate_max
 
     dist_transport = float(assessment_data.get('dist_transport', 9999) or 9999)
-    if dist_transport <= 400:
-        transport_multiplier = 1.10
-        proximity_band = 'Enterprise Intelligence Active (<=400m)'
-    elif dist_transport <= 800:
-        transport_multiplier = 1.00
-        proximity_band = 'Strong access (<=800m)'
-    elif dist_transport <= 1200:
-        transport_multiplier = 0.92
-        proximity_band = 'Moderate access (<=1200m)'
-    else:
-        transport_multiplier = 0.85
-        proximity_band = 'Limited access (>1200m)'
-
-    weekly_min = round(base_weekly_min * transport_multiplier)
-    weekly_max = round(base_weekly_max * transport_multiplier)
-
-    annual_min = round(weekly_min * 52)
-    annual_max = round(weekly_max * 52)
-
-    midpoint_weekly = round((weekly_min + weekly_max) / 2)
-    midpoint_annual = round((annual_min + annual_max) / 2)
-
-    return {
-        'project_type': thresholds['project_type'],
-        'units_assumed': units,
-        'rooms_assumed': units,
-        'weekly_min': weekly_min,
-        'weekly_max': weekly_max,
-        'weekly_midpoint': midpoint_weekly,
-        'annual_min': annual_min,
-        'annual_max': annual_max,
-        'annual_midpoint': midpoint_annual,
-        'transport_multiplier': transport_multiplier,
-        'proximity_band': proximity_band,
-    }
-
-def calculate_weighted_score(assessment_data):
+    band = bisect.bisect_left(_TRANSPORT_REV_THRESHOLDS, dist_transport)
+    transport_multiplier = _TRANSPORT_REV_MULTIPLIERS[band]
+
+    # Values are non-negative, so int(x + 0.5) rounds half-up without the
+    # round() call overhead.
+    weekly_min = int(units * min_per_unit * transport_multiplier + 0.5)
+    weekly_max = int(units * max_per_unit * transport_multiplier + 0.5)
+
+    annual_min = weekly_min * 52
+    annual_max = weekly_max * 52
+
+    midpoint_weekly = (weekly_min + weekly_max + 1) // 2
+    midpoint_annual = (annual_min + annual_max + 1) // 2
+
+    return dict(zip(_REV_KEYS, (
+        thresholds.project_type,
+        units,
+        units,
+        weekly_min,
+        weekly_max,
+        midpoint_weekly,
+        annual_min,
+        annual_max,
+        midpoint_annual,
+        transport_multiplier,
+        _PROXIMITY_BANDS[band],
+    )))
+
+# Transport ladder: bisect_left on the thresholds maps dist <= 400 to band 0,
+# 401-600 to band 1, and so on; the score/feedback tuples are indexed by band.
+_TRANSPORT_THRESHOLDS = (400, 600, 800, 1000)
+_TRANSPORT_SCORES = (25, 22, 18, 10, 0)
+_TRANSPORT_FEEDBACK = (
+    "Excellent: {dist}m is within highly preferred catchment",
+    "Good: {dist}m within preferred transport catchment",
+    "Acceptable: {dist}m at edge of recommended catchment",
+    "Limited: {dist}m requires traffic engineering assessment",
+    "Poor: {dist}m significantly outside recommended catchment",
+)
+
+# Compliance score/feedback indexed by number of confirmed checks (0-3).
+_COMPLIANCE_SCORES = (0, 3, 6, 10)
+_COMPLIANCE_FEEDBACK = (
+    " - Major upgrades required",
+    " - Significant upgrades required",
+    " - Minor upgrades needed",
+    " - Fully compliant",
+)
+
+
+def calculate_weighted_score(assessment_data, fast_reject=False):
     """
     Calculate a weighted viability score (0-100) based on assessment criteria.
-    
+
     Weights:
     - Zone: 40%
     - Transport: 25%
     - Physical: 25%
     - Compliance: 10%
+
+    With fast_reject=True, hard-fail sites (overlay or covenant present)
+    return 0.0 immediately without computing the transport, physical or
+    compliance components. Use it for first-pass screening of large
+    candidate lists where hard-fail sites are discarded anyway; the
+    default keeps the full score, which can still reach 60 on a hard-fail
+    site.
     """
-    
+
     ZONE_WEIGHT = 0.40
     TRANSPORT_WEIGHT = 0.25
     PHYSICAL_WEIGHT = 0.25
     COMPLIANCE_WEIGHT = 0.10
-    project_type = _normalize_project_type(assessment_data.get('project_type'))
-    thresholds = get_logic_thresholds(project_type)
-    
+
     # Zone Score (0-25)
     zone_score = 0
     if assessment_data.get('has_overlay') or assessment_data.get('has_covenant'):
+        if fast_reject:
+            return 0.0
         zone_score = 0  # Hard fail
     elif assessment_data.get('is_preferred_zone'):
         zone_score = 25  # Perfect score for preferred zones
@@ -333,25 +506,16 @@ def calculate_weighted_score(assessment_data):
         zone_score = 10  # Low score for non-preferred zones
     
     # Transport Score (0-25)
-    transport_score = 0
+    project_type = _normalize_project_type(assessment_data.get('project_type'))
+    thresholds = _logic_thresholds_nt(project_type)
     dist = assessment_data.get('dist_transport', 1000)
-    
-    if dist <= 400:
-        transport_score = 25  # Excellent
-    elif dist <= 600:
-        transport_score = 22  # Very good
-    elif dist <= 800:
-        transport_score = 18  # Good
-    elif dist <= 1000:
-        transport_score = 10  # Acceptable
-    else:
-        transport_score = 0  # Poor
+    transport_score = _TRANSPORT_SCORES[bisect.bisect_left(_TRANSPORT_THRESHOLDS, dist)]
 
-    if thresholds['requires_hospital_proximity']:
+    if thresholds.requires_hospital_proximity:
         nearest_hospital_m = _nearest_hospital_distance_m(assessment_data)
         if nearest_hospital_m is None:
             transport_score = min(transport_score, 8)
-        elif nearest_hospital_m > thresholds['max_hospital_distance_m']:
+        elif nearest_hospital_m > thresholds.max_hospital_distance_m:
             transport_score = min(transport_score, 8)
     
     # Physical Suitability Score (0-25) - Blueprint V1.1
@@ -369,21 +533,12 @@ def calculate_weighted_score(assessment_data):
     )
     
     # Compliance Score (0-10)
-    compliance_score = 0
-    compliance_checks = sum([
-        assessment_data.get('check_heating', 0),
-        assessment_data.get('check_windows', 0),
-        assessment_data.get('check_energy', 0)
-    ])
-    
-    # Map compliance checks to score
-    compliance_map = {
-        0: 0,
-        1: 3,
-        2: 6,
-        3: 10
-    }
-    compliance_score = compliance_map.get(compliance_checks, 0)
+    compliance_checks = (
+        (assessment_data.get('check_heating') or 0)
+        + (assessment_data.get('check_windows') or 0)
+        + (assessment_data.get('check_energy') or 0)
+    )
+    compliance_score = _COMPLIANCE_SCORES[compliance_checks] if 0 <= compliance_checks <= 3 else 0
     
     # Calculate weighted total (0-100)
     total_score = (
@@ -395,82 +550,248 @@ def calculate_weighted_score(assessment_data):
     
     return round(total_score, 1)
 
+@njit(cache=True, fastmath=True)
+def _physical_scores_batch_kernel(width, depth, area, slope_code, min_width, min_depth, max_depth, area_min, area_max, out):
+    """Row-at-a-time physical scores into an int32 out array; numba-only path."""
+    for i in range(width.shape[0]):
+        phys, _, _, _, _ = _physical_score_kernel(
+            width[i], depth[i], area[i], slope_code[i],
+            min_width[i], min_depth[i], max_depth[i], area_min[i], area_max[i],
+        )
+        out[i] = phys
+
+
+@dataclasses.dataclass
+class LotBatch:
+    """
+    Column-oriented batch of lots for the vectorized scorer.
+
+    Each field is a numpy array over the whole batch; slope and project
+    type are pre-encoded as small ints (slope: Flat=2, Moderate=1, else 0;
+    type_code: index into _PROJECT_TYPE_ORDER) so the hot loop never
+    touches Python strings. Build one with LotBatch.from_columns.
+    """
+
+    width: object
+    depth: object
+    area: object
+    dist: object
+    slope_code: object
+    type_code: object
+    overlay: object
+    covenant: object
+    preferred: object
+    checks: object
+    nearest_hospital_m: object = None
+
+    @classmethod
+    def from_columns(cls, data):
+        """Encode a column mapping (dict of sequences or DataFrame) into arrays."""
+        import numpy as np
+
+        slope = np.asarray(data['slope'], dtype=object)
+        return cls(
+            width=np.asarray(data['lot_width'], dtype=np.float64),
+            depth=np.asarray(data['lot_depth'], dtype=np.float64),
+            area=np.asarray(data['lot_area'], dtype=np.float64),
+            dist=np.asarray(data['dist_transport'], dtype=np.float64),
+            slope_code=np.select([slope == 'Flat', slope == 'Moderate'], [2, 1], 0).astype(np.int8),
+            type_code=np.array(
+                [_PROJECT_TYPE_CODES[_normalize_project_type(pt)] for pt in data['project_type']],
+                dtype=np.int8,
+            ),
+            overlay=np.asarray(data['has_overlay'], dtype=bool),
+            covenant=np.asarray(data['has_covenant'], dtype=bool),
+            preferred=np.asarray(data['is_preferred_zone'], dtype=bool),
+            checks=(
+                np.asarray(data['check_heating'], dtype=np.int64)
+                + np.asarray(data['check_windows'], dtype=np.int64)
+                + np.asarray(data['check_energy'], dtype=np.int64)
+            ),
+            nearest_hospital_m=(
+                np.asarray(data['nearest_hospital_m'], dtype=np.float64)
+                if 'nearest_hospital_m' in data
+                else None
+            ),
+        )
+
+
+def calculate_weighted_scores_batch(data):
+    """
+    Vectorized calculate_weighted_score over N sites at once.
+
+    `data` is a LotBatch, or a mapping of column name to sequence (a dict
+    of arrays or a pandas DataFrame) with columns lot_width, lot_depth,
+    lot_area, slope, dist_transport, has_overlay, has_covenant,
+    is_preferred_zone, check_heating, check_windows, check_energy,
+    project_type. An optional nearest_hospital_m column drives the SDA
+    hospital cap; without it, SDA rows are capped as "unknown", matching
+    the scalar behaviour for missing hospital data. Returns a float64
+    array of weighted totals.
+    """
+    import numpy as np
+
+    batch = data if isinstance(data, LotBatch) else LotBatch.from_columns(data)
+    width = batch.width
+    depth = batch.depth
+    area = batch.area
+    dist = batch.dist
+    overlay = batch.overlay
+    covenant = batch.covenant
+    preferred = batch.preferred
+    checks = batch.checks
+    codes = batch.type_code
+
+    thr = [_NT_BY_TYPE[pt] for pt in _PROJECT_TYPE_ORDER]
+    min_width = np.array([t.min_width for t in thr])[codes]
+    min_depth = np.array([t.min_depth for t in thr])[codes]
+    max_depth = np.array([t.max_depth for t in thr])[codes]
+    area_min = np.array([t.target_area_min for t in thr])[codes]
+    area_max = np.array([t.target_area_max for t in thr])[codes]
+    needs_hospital = np.array([t.requires_hospital_proximity for t in thr], dtype=bool)[codes]
+    max_hospital = np.array(
+        [t.max_hospital_distance_m or np.inf for t in thr], dtype=np.float64
+    )[codes]
+
+    if NUMBA_AVAILABLE:
+        # Single fused pass; the jitted row loop beats materializing the
+        # np.select condition masks below.
+        physical_score = np.empty(width.shape[0], dtype=np.int32)
+        _physical_scores_batch_kernel(
+            width, depth, area, batch.slope_code,
+            min_width, min_depth, max_depth, area_min, area_max,
+            physical_score,
+        )
+    else:
+        width_score = np.select(
+            [
+                width >= min_width,
+                width >= np.maximum(12.0, min_width - 0.5),
+                width >= np.maximum(11.5, min_width - 1.0),
+            ],
+            [8, 5, 2],
+            0,
+        )
+        depth_score = np.select(
+            [
+                (min_depth <= depth) & (depth <= max_depth),
+                ((min_depth - 1.6) <= depth) & (depth <= (max_depth + 2.4)),
+                depth >= (min_depth - 3.6),
+            ],
+            [8, 5, 2],
+            0,
+        )
+        area_score = np.select(
+            [
+                (area_min <= area) & (area <= area_max),
+                (np.maximum(280.0, area_min - 40.0) <= area) & (area <= (area_max + 80.0)),
+                area >= np.maximum(240.0, area_min - 90.0),
+            ],
+            [6, 4, 1],
+            0,
+        )
+        slope_score = np.select([batch.slope_code == 2, batch.slope_code == 1], [3, 2], 0)
+        physical_score = np.minimum(25, width_score + depth_score + area_score + slope_score)
+
+    zone_score = np.where(overlay | covenant, 0, np.where(preferred, 25, 10))
+
+    transport_score = np.select(
+        [dist <= 400, dist <= 600, dist <= 800, dist <= 1000], [25, 22, 18, 10], 0
+    )
+    if batch.nearest_hospital_m is not None:
+        hospital = batch.nearest_hospital_m
+        capped = needs_hospital & (np.isnan(hospital) | (hospital > max_hospital))
+    else:
+        capped = needs_hospital
+    transport_score = np.where(capped, np.minimum(transport_score, 8), transport_score)
+
+    compliance_score = np.array([0, 3, 6, 10])[np.clip(checks, 0, 3)]
+
+    total = (
+        zone_score / 25 * 0.40
+        + transport_score / 25 * 0.25
+        + physical_score / 25 * 0.25
+        + compliance_score / 10 * 0.10
+    ) * 100
+    return np.round(total, 1)
+
+
+# Status payloads are constant, so share read-only views instead of building
+# a fresh dict per lookup. Indexed low/conditional/high.
+_STATUS_LOW = types.MappingProxyType({
+    'status': 'NOT SUITABLE',
+    'color': 'red',
+    'message': 'Site has significant constraints that limit viability.'
+})
+_STATUS_CONDITIONAL = types.MappingProxyType({
+    'status': 'CONDITIONAL',
+    'color': 'orange',
+    'message': 'Site has potential but requires addressing identified constraints.'
+})
+_STATUS_HIGH = types.MappingProxyType({
+    'status': 'HIGHLY SUITABLE',
+    'color': 'green',
+    'message': 'Site meets key criteria for rooming house development.'
+})
+_STATUS_BY_BAND = (_STATUS_LOW, _STATUS_CONDITIONAL, _STATUS_HIGH)
+
+
 def get_viability_status_from_score(score):
     """
     Determine viability status based on weighted score.
     """
-    if score >= 75:
-        return {
-            'status': 'HIGHLY SUITABLE',
-            'color': 'green',
-            'message': 'Site meets key criteria for rooming house development.'
-        }
-    elif score >= 50:
-        return {
-            'status': 'CONDITIONAL',
-            'color': 'orange',
-            'message': 'Site has potential but requires addressing identified constraints.'
-        }
-    else:
-        return {
-            'status': 'NOT SUITABLE',
-            'color': 'red',
-            'message': 'Site has significant constraints that limit viability.'
-        }
+    return _STATUS_BY_BAND[(score >= 50) + (score >= 75)]
 
-def detailed_score_breakdown(assessment_data):
+def detailed_score_breakdown(assessment_data, include_feedback=True):
     """
     Return detailed breakdown of score components.
+
+    When include_feedback is False the feedback strings are left empty,
+    skipping the string formatting work for callers that only need the
+    numeric components.
     """
-    
+
     # Zone component
     zone_score = 0
     zone_feedback = ""
     if assessment_data.get('has_overlay'):
-        zone_feedback = "Heritage/Character overlay restricts density (HARD FAIL)"
+        if include_feedback:
+            zone_feedback = "Heritage/Character overlay restricts density (HARD FAIL)"
         zone_score = 0
     elif assessment_data.get('has_covenant'):
-        zone_feedback = "Single dwelling covenant restricts multi-occupancy (HARD FAIL)"
+        if include_feedback:
+            zone_feedback = "Single dwelling covenant restricts multi-occupancy (HARD FAIL)"
         zone_score = 0
     elif assessment_data.get('is_preferred_zone'):
-        zone_feedback = "Preferred zone (GRZ/RGZ) suitable for rooming houses"
+        if include_feedback:
+            zone_feedback = "Preferred zone (GRZ/RGZ) suitable for rooming houses"
         zone_score = 25
     else:
-        zone_feedback = "Non-preferred zone - limited density allowances"
+        if include_feedback:
+            zone_feedback = "Non-preferred zone - limited density allowances"
         zone_score = 10
-    
+
     # Transport component
     project_type = _normalize_project_type(assessment_data.get('project_type'))
-    thresholds = get_logic_thresholds(project_type)
+    thresholds = _logic_thresholds_nt(project_type)
     dist = assessment_data.get('dist_transport', 1000)
-    transport_score = 0
-    if dist <= 400:
-        transport_feedback = f"Excellent: {dist}m is within highly preferred catchment"
-        transport_score = 25
-    elif dist <= 600:
-        transport_feedback = f"Good: {dist}m within preferred transport catchment"
-        transport_score = 22
-    elif dist <= 800:
-        transport_feedback = f"Acceptable: {dist}m at edge of recommended catchment"
-        transport_score = 18
-    elif dist <= 1000:
-        transport_feedback = f"Limited: {dist}m requires traffic engineering assessment"
-        transport_score = 10
-    else:
-        transport_feedback = f"Poor: {dist}m significantly outside recommended catchment"
-        transport_score = 0
+    band = bisect.bisect_left(_TRANSPORT_THRESHOLDS, dist)
+    transport_score = _TRANSPORT_SCORES[band]
+    transport_feedback = _TRANSPORT_FEEDBACK[band].format(dist=dist) if include_feedback else ""
 
-    if thresholds['requires_hospital_proximity']:
+    if thresholds.requires_hospital_proximity:
         nearest_hospital_m = _nearest_hospital_distance_m(assessment_data)
         if nearest_hospital_m is None:
-            transport_feedback += " | SDA/NDIS hospital proximity: unknown (target ≤5km)"
+            if include_feedback:
+                transport_feedback += " | SDA/NDIS hospital proximity: unknown (target ≤5km)"
             transport_score = min(transport_score, 8)
-        elif nearest_hospital_m > thresholds['max_hospital_distance_m']:
-            transport_feedback += f" | SDA/NDIS hospital proximity not met ({nearest_hospital_m/1000:.1f}km > 5.0km)"
+        elif nearest_hospital_m > thresholds.max_hospital_distance_m:
+            if include_feedback:
+                transport_feedback += f" | SDA/NDIS hospital proximity not met ({nearest_hospital_m/1000:.1f}km > 5.0km)"
             transport_score = min(transport_score, 8)
-        else:
+        elif include_feedback:
             transport_feedback += f" | SDA/NDIS hospital proximity met ({nearest_hospital_m/1000:.1f}km)"
-    
+
     # Physical component
     lot_width = assessment_data.get('lot_width', 0)
     lot_depth = assessment_data.get('lot_depth', 0)
@@ -478,44 +799,45 @@ def detailed_score_breakdown(assessment_data):
     slope = assessment_data.get('slope', 'Moderate')
 
     physical_feedback = []
-    if lot_width >= thresholds['min_width']:
-        physical_feedback.append(f"Width {lot_width:.2f}m: Meets minimum (≥{thresholds['min_width']:.2f}m)")
-    elif lot_width >= 12.0:
-        physical_feedback.append(f"Width {lot_width:.2f}m: Near minimum (target ≥{thresholds['min_width']:.2f}m)")
-    else:
-        physical_feedback.append(f"Width {lot_width:.2f}m: Below minimum")
-
-    if thresholds['min_depth'] <= lot_depth <= thresholds['max_depth']:
-        physical_feedback.append(f"Depth {lot_depth:.2f}m: In target ({thresholds['min_depth']:.1f}-{thresholds['max_depth']:.1f}m)")
-    else:
-        physical_feedback.append(f"Depth {lot_depth:.2f}m: Outside target ({thresholds['min_depth']:.1f}-{thresholds['max_depth']:.1f}m)")
-
-    if thresholds['target_area_min'] <= lot_area <= thresholds['target_area_max']:
-        physical_feedback.append(f"Area {lot_area:.1f}m²: In target ({thresholds['target_area_min']:.0f}-{thresholds['target_area_max']:.0f}m²)")
-    else:
-        physical_feedback.append(f"Area {lot_area:.1f}m²: Outside target ({thresholds['target_area_min']:.0f}-{thresholds['target_area_max']:.0f}m²)")
+    if include_feedback:
+        if lot_width >= thresholds.min_width:
+            physical_feedback.append(f"Width {lot_width:.2f}m: Meets minimum (≥{thresholds.min_width:.2f}m)")
+        elif lot_width >= 12.0:
+            physical_feedback.append(f"Width {lot_width:.2f}m: Near minimum (target ≥{thresholds.min_width:.2f}m)")
+        else:
+            physical_feedback.append(f"Width {lot_width:.2f}m: Below minimum")
 
-    if project_type == PROJECT_TYPE_DUAL_OCC:
-        if lot_area >= 650:
-            physical_feedback.append("Dual Occupancy lot area check: PASS (≥650m²)")
+        if thresholds.min_depth <= lot_depth <= thresholds.max_depth:
+            physical_feedback.append(f"Depth {lot_depth:.2f}m: In target ({thresholds.min_depth:.1f}-{thresholds.max_depth:.1f}m)")
         else:
-            physical_feedback.append("Dual Occupancy lot area check: FAIL (<650m²)")
+            physical_feedback.append(f"Depth {lot_depth:.2f}m: Outside target ({thresholds.min_depth:.1f}-{thresholds.max_depth:.1f}m)")
 
-    if slope == "Flat":
-        physical_feedback.append("Slope: Ideal for development")
-    elif slope == "Moderate":
-        physical_feedback.append("Slope: Moderate - requires geotechnical assessment")
-    else:
-        physical_feedback.append("Slope: Steep - high SDA access costs")
+        if thresholds.target_area_min <= lot_area <= thresholds.target_area_max:
+            physical_feedback.append(f"Area {lot_area:.1f}m²: In target ({thresholds.target_area_min:.0f}-{thresholds.target_area_max:.0f}m²)")
+        else:
+            physical_feedback.append(f"Area {lot_area:.1f}m²: Outside target ({thresholds.target_area_min:.0f}-{thresholds.target_area_max:.0f}m²)")
+
+        if project_type == PROJECT_TYPE_DUAL_OCC:
+            if lot_area >= 650:
+                physical_feedback.append("Dual Occupancy lot area check: PASS (≥650m²)")
+            else:
+                physical_feedback.append("Dual Occupancy lot area check: FAIL (<650m²)")
+
+        if slope == "Flat":
+            physical_feedback.append("Slope: Ideal for development")
+        elif slope == "Moderate":
+            physical_feedback.append("Slope: Moderate - requires geotechnical assessment")
+        else:
+            physical_feedback.append("Slope: Steep - high SDA access costs")
 
-    setback_requirements = evaluate_setback_requirements(lot_depth, project_type)
-    physical_feedback.append(
-        f"Setbacks required: Front {setback_requirements['front_setback_m']:.0f}m, Rear {setback_requirements['rear_setback_min_m']:.0f}-{setback_requirements['rear_setback_max_m']:.0f}m"
-    )
-    if not setback_requirements['supports_minimum_blueprint_with_setbacks']:
+        setback_requirements = evaluate_setback_requirements(lot_depth, project_type)
         physical_feedback.append(
-            f"Lot depth may not support Blueprint + setbacks (minimum total depth {setback_requirements['required_total_depth_min_m']:.1f}m)"
+            f"Setbacks required: Front {setback_requirements['front_setback_m']:.0f}m, Rear {setback_requirements['rear_setback_min_m']:.0f}-{setback_requirements['rear_setback_max_m']:.0f}m"
         )
+        if not setback_requirements['supports_minimum_blueprint_with_setbacks']:
+            physical_feedback.append(
+                f"Lot depth may not support Blueprint + setbacks (minimum total depth {setback_requirements['required_total_depth_min_m']:.1f}m)"
+            )
 
     physical_score, _, _, _, _ = _calculate_project_physical_score(
         lot_width,
@@ -526,25 +848,20 @@ def detailed_score_breakdown(assessment_data):
     )
     
     # Compliance component
-    compliance_checks = sum([
-        assessment_data.get('check_heating', 0),
-        assessment_data.get('check_windows', 0),
-        assessment_data.get('check_energy', 0)
-    ])
+    compliance_checks = (
+        (assessment_data.get('check_heating') or 0)
+        + (assessment_data.get('check_windows') or 0)
+        + (assessment_data.get('check_energy') or 0)
+    )
     
-    compliance_feedback = f"{compliance_checks}/3 standards confirmed"
-    if compliance_checks == 3:
-        compliance_feedback += " - Fully compliant"
-        compliance_score = 10
-    elif compliance_checks == 2:
-        compliance_feedback += " - Minor upgrades needed"
-        compliance_score = 6
-    elif compliance_checks == 1:
-        compliance_feedback += " - Significant upgrades required"
-        compliance_score = 3
-    else:
-        compliance_feedback += " - Major upgrades required"
-        compliance_score = 0
+    in_range = 0 <= compliance_checks <= 3
+    compliance_score = _COMPLIANCE_SCORES[compliance_checks] if in_range else 0
+    compliance_feedback = ""
+    if include_feedback:
+        compliance_feedback = (
+            f"{compliance_checks}/3 standards confirmed"
+            + _COMPLIANCE_FEEDBACK[compliance_checks if in_range else 0]
+        )
     
     return {
         'zone': {
@@ -576,3 +893,61 @@ def detailed_score_breakdown(assessment_data):
             'weighted_score': (compliance_score / 10) * 0.10 * 100
         }
     }
+
+
+def detailed_score_breakdown_numeric(assessment_data):
+    """
+    Numeric-only breakdown: the same four components as
+    detailed_score_breakdown, each reduced to score/max/weight/
+    weighted_score with no feedback strings. Use this for batch or
+    screening runs where the text is never shown.
+    """
+    breakdown = detailed_score_breakdown(assessment_data, include_feedback=False)
+    return {
+        name: {
+            'score': part['score'],
+            'max': part['max'],
+            'weight': part['weight'],
+            'weighted_score': part['weighted_score'],
+        }
+        for name, part in breakdown.items()
+    }
+
+
+def assess_all(assessment_data):
+    """
+    Run the scoring pipeline once and return score, breakdown, viability,
+    and design validation together.
+
+    Callers that need all of these (the main assessment flow) previously
+    invoked calculate_weighted_score and detailed_score_breakdown
+    back-to-back, re-reading the same lot fields and recomputing every
+    component twice. The weighted total here is derived from the
+    breakdown's weighted components, which use the identical formula.
+    """
+    project_type = _normalize_project_type(assessment_data.get('project_type'))
+    breakdown = detailed_score_breakdown(assessment_data)
+    weighted_score = round(sum(part['weighted_score'] for part in breakdown.values()), 1)
+    design_validation = validate_urhh_design(
+        assessment_data.get('lot_width', 0),
+        assessment_data.get('lot_depth', 0),
+        assessment_data.get('lot_area', 0),
+        project_type,
+        assessment_data=assessment_data,
+    )
+    return {
+        'weighted_score': weighted_score,
+        'viability': get_viability_status_from_score(weighted_score),
+        'breakdown': breakdown,
+        'design_validation': design_validation,
+    }
+
+
+# Warm the physical-score kernels at import so the first assessment does not
+# pay the JIT compile cost when numba is installed.
+try:
+    _physical_score_kernel(0.0, 0.0, 0.0, 0, BLUEPRINT_MIN_WIDTH, BLUEPRINT_MIN_DEPTH, BLUEPRINT_MAX_DEPTH, BLUEPRINT_MIN_AREA, BLUEPRINT_MAX_AREA)
+    for _kernel in _PHYSICAL_KERNELS:
+        _kernel(0.0, 0.0, 0.0, 0)
+except Exception:
+    pass
@@ -260,12 +260,14 @@ def _load_poi_cache(latitude: float, longitude: float, poi_type: str, radius_km:
     try:
         base_dir = os.path.dirname(__file__)
         cache_path = os.path.join(base_dir, 'data', 'poi_cache.json')
-        if not os.path.exists(cache_path):
+        # Open directly: a missing file is the common case and catching
+        # FileNotFoundError avoids the extra stat() of os.path.exists.
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as fh:
+                cache = json.load(fh)
+        except FileNotFoundError:
             return []
 
-        with open(cache_path, 'r', encoding='utf-8') as fh:
-            cache = json.load(fh)
-
         items = cache.get(poi_type, [])
         results = []
         for element in items:
@@ -313,6 +315,20 @@ def _generate_dummy_pois(latitude: float, longitude: float, poi_type: str) -> Li
         })
     return samples
 
+POI_CATEGORIES = ('transit', 'schools', 'parks', 'shops', 'heritage', 'hospitals')
+
+
+def prefetch_pois(latitude: float, longitude: float) -> Dict[str, List[Dict]]:
+    """
+    Fetch all POI categories for a site up front.
+
+    Lets the search handler overlap POI fetches with the (also HTTP-bound)
+    auto-assessment, and lets the later map render reuse the results via
+    the poi_data kwarg of create_advanced_map instead of re-querying.
+    """
+    return {category: get_poi_data(latitude, longitude, category) for category in POI_CATEGORIES}
+
+
 def create_advanced_map(
     latitude: float,
     longitude: float,
@@ -327,6 +343,7 @@ def create_advanced_map(
     zone_type: str = "",
     has_overlay: bool = False,
     zoom_start: int = 16,
+    poi_data: Dict = None,
 ) -> Tuple[folium.Map, Dict]:
     """
     Create an advanced folium map with POIs and multiple layers
@@ -342,11 +359,17 @@ def create_advanced_map(
         show_shops: Show shops nearby
         show_heritage: Show heritage sites
         map_type: Type of map tile ('OpenStreetMap', 'Satellite', 'Hybrid')
-    
+        poi_data: Optional prefetched POIs (from prefetch_pois) to avoid re-querying
+
     Returns:
         Tuple of (folium map, POI summary dict)
     """
-    
+
+    def _pois(poi_type: str) -> List[Dict]:
+        if poi_data and poi_data.get(poi_type) is not None:
+            return poi_data[poi_type]
+        return get_poi_data(latitude, longitude, poi_type)
+
     # Map tile options
     tiles = {
         'OpenStreetMap': 'OpenStreetMap',
@@ -467,7 +490,7 @@ def create_advanced_map(
 
     # Add transit stops
     if show_transit:
-        transit_pois = get_poi_data(latitude, longitude, 'transit')
+        transit_pois = _pois('transit')
         for poi in transit_pois[:30]:  # Limit for performance
             folium.CircleMarker(
                 location=[poi['lat'], poi['lon']],
@@ -483,7 +506,7 @@ def create_advanced_map(
     
     # Add schools
     if show_schools:
-        school_pois = get_poi_data(latitude, longitude, 'schools')
+        school_pois = _pois('schools')
         for poi in school_pois[:30]:
             folium.CircleMarker(
                 location=[poi['lat'], poi['lon']],
@@ -499,7 +522,7 @@ def create_advanced_map(
     
     # Add parks
     if show_parks:
-        park_pois = get_poi_data(latitude, longitude, 'parks')
+        park_pois = _pois('parks')
         for poi in park_pois[:30]:
             folium.CircleMarker(
                 location=[poi['lat'], poi['lon']],
@@ -515,7 +538,7 @@ def create_advanced_map(
     
     # Add shops
     if show_shops:
-        shop_pois = get_poi_data(latitude, longitude, 'shops')
+        shop_pois = _pois('shops')
         for poi in shop_pois[:30]:
             folium.CircleMarker(
                 location=[poi['lat'], poi['lon']],
@@ -531,7 +554,7 @@ def create_advanced_map(
     
     # Add heritage sites
     if show_heritage:
-        heritage_pois = get_poi_data(latitude, longitude, 'heritage')
+        heritage_pois = _pois('heritage')
         for poi in heritage_pois[:30]:
             folium.CircleMarker(
                 location=[poi['lat'], poi['lon']],
@@ -546,7 +569,7 @@ def create_advanced_map(
             poi_summary['heritage'].append(poi)
 
     # Add hospitals (always show)
-    hospital_pois = get_poi_data(latitude, longitude, 'hospitals')
+    hospital_pois = _pois('hospitals')
     for poi in hospital_pois[:30]:
         folium.CircleMarker(
             location=[poi['lat'], poi['lon']],